@@ -1,5 +1,6 @@
+import importlib.util
 import os
-from sqlalchemy import create_engine, Column, String
+from sqlalchemy import create_engine, event, Column, String
 from sqlalchemy.orm import declarative_base, sessionmaker
 from pathlib import Path
 
@@ -13,10 +14,74 @@ if not DATABASE_URL:
 
 print(f"📊 Database URL: {DATABASE_URL}")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+# Connection pool (ignored for in-memory SQLite, which has a single connection)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Recycle connections before the server or a proxy drops them as idle
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Test each connection on checkout so stale ones are replaced, not raised
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+# SQLite: write-ahead log lets readers proceed while a write is in progress
+SQLITE_WAL = os.getenv("SQLITE_WAL", "true").lower() in ("1", "true", "yes")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+# Async engine for the login path; used when the driver is installed
+DB_ASYNC = os.getenv("DB_ASYNC", "true").lower() in ("1", "true", "yes")
+
+# URL scheme -> (async scheme, driver module)
+ASYNC_DRIVERS = {
+    "sqlite": ("sqlite+aiosqlite", "aiosqlite"),
+    "postgresql": ("postgresql+asyncpg", "asyncpg"),
+    "postgres": ("postgresql+asyncpg", "asyncpg"),
+}
+
+
+def _engine_options(url: str) -> dict:
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+        if ":memory:" in url or "mode=memory" in url or url.rstrip("/").endswith(":"):
+            return options
+    options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    return options
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    if SQLITE_WAL:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
+def _async_url(url: str):
+    """
+    Async variant of the database URL, or None when the async driver (or
+    greenlet, which SQLAlchemy's asyncio layer needs) is not installed.
+    """
+    scheme, sep, rest = url.partition("://")
+    driver = ASYNC_DRIVERS.get(scheme.split("+")[0])
+    if driver is None or not sep:
+        return None
+    async_scheme, module = driver
+    if importlib.util.find_spec(module) is None or importlib.util.find_spec("greenlet") is None:
+        return None
+    return f"{async_scheme}://{rest}"
+
+
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+if IS_SQLITE:
+    event.listen(engine, "connect", _sqlite_pragmas)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -24,6 +89,20 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or (_async_url(DATABASE_URL) if DB_ASYNC else None)
+
+async_engine = None
+AsyncSessionLocal = None
+
+if ASYNC_DATABASE_URL:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL))
+    if IS_SQLITE:
+        event.listen(async_engine.sync_engine, "connect", _sqlite_pragmas)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    print(f"📊 Async database driver: {ASYNC_DATABASE_URL.split('://')[0]}")
+
 Base = declarative_base()
 
 
@@ -45,5 +124,6 @@ def get_db():
         db.close()
 
 
-# ✅ Create tables
-Base.metadata.create_all(bind=engine)
+# ✅ Create tables (called once at startup, not at import)
+def init_tables():
+    Base.metadata.create_all(bind=engine)
@@ -1,7 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from pathlib import Path
 import os
+import tempfile
+import time
 
 # Routers
 from app.routes.auth import router as auth_router
@@ -11,84 +14,166 @@ from app.routes.engine import router as engine_router
 from app.routes.battery import router as battery_router
 from app.routes.brakes import router as brakes_router
 from app.routes.mcp import router as mcp_router
+from app.routes.vehicles import router as vehicles_router
+from app.routes.telemetry import router as telemetry_router
+from app.routes.dashboard import router as dashboard_router
+from app.routes.metrics import router as metrics_router
+from app.routes.risk import router as risk_router
+from app.routes.timeseries import router as timeseries_router
 
 # Database and initialization
-from app.db import SessionLocal, User, Base, engine
-from app.utils.security import hash_password
+from app.utils.brand_stats import shutdown_pool
+from app.utils.compression import CompressionMiddleware
+from app.utils.csv_loader import describe_data_dir
+from app.utils.locks import file_lock
+from app.utils.metrics import MetricsMiddleware
+from app.utils.responses import FastJSONResponse
+from app.utils.security import hash_passwords, prepare_dummy_hash
+from app.utils.view_registry import validate_views
+
+FALLBACK_BRANDS = ["ford", "honda", "toyota", "bmw", "audi", "chevrolet", "nissan", "hyundai", "kia", "mercedes-benz"]
+DEFAULT_PASSWORD = "admin123"
+
+# Cold start above this many seconds is reported as a warning
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "5"))
+# Serializes initialization across uvicorn workers on the same host
+STARTUP_LOCK_FILE = Path(os.getenv("STARTUP_LOCK_FILE", Path(tempfile.gettempdir()) / "oem-analytics-init.lock"))
+
+# Responses smaller than this many bytes are sent uncompressed
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+_initialized = False
+
+
+def _default_brands():
+    # Get all brand directories from data folder
+    data_dir = Path(__file__).resolve().parent.parent.parent / "data" / "processed"
+
+    if not data_dir.exists():
+        print(f"⚠️  Data directory not found at {data_dir}")
+        print("Creating fallback users for common brands...")
+        return FALLBACK_BRANDS
+
+    return [brand_dir.name.lower() for brand_dir in data_dir.iterdir() if brand_dir.is_dir()]
 
-app = FastAPI(title="OEM Analytics API")
 
 # ✅ INITIALIZE DATABASE AND USERS ON STARTUP
-def init_db():
-    """Create tables and default users if they don't exist"""
+def init_db() -> dict:
+    """
+    Create tables, and default users when the users table is empty.
+    Returns per-phase timings in seconds.
+    """
+    # SQLAlchemy is imported here so importing app.main stays cheap
+    from app.db import SessionLocal, User, init_tables
+
+    timings = {}
+
+    started = time.perf_counter()
     try:
-        Base.metadata.create_all(bind=engine)
+        init_tables()
         print("✅ Database tables created successfully")
     except Exception as e:
         print(f"⚠️  Error creating tables: {e}")
-        return
-    
+        return timings
+    timings["create_tables"] = time.perf_counter() - started
+
     db = SessionLocal()
-    
+
     try:
-        # Check if users already exist
-        user_count = db.query(User).count()
-        
-        if user_count == 0:
+        started = time.perf_counter()
+        # Seed only an empty users table: accounts an operator removed (or
+        # whose password was changed) must not come back on the next deploy
+        has_users = db.query(User.email).first() is not None
+        timings["check_users"] = time.perf_counter() - started
+
+        if not has_users:
             print("🔄 Initializing database with default users...")
-            
-            # Get all brand directories from data folder
-            data_dir = Path(__file__).resolve().parent.parent.parent / "data" / "processed"
-            
-            if not data_dir.exists():
-                print(f"⚠️  Data directory not found at {data_dir}")
-                print("Creating fallback users for common brands...")
-                brands = ["ford", "honda", "toyota", "bmw", "audi", "chevrolet", "nissan", "hyundai", "kia", "mercedes-benz"]
-                
-                for brand in brands:
-                    email = f"{brand}_admin@oem.com"
-                    existing_user = db.query(User).filter(User.email == email).first()
-                    if not existing_user:
-                        user = User(
-                            email=email,
-                            password_hash=hash_password("admin123"),
-                            brand=brand
-                        )
-                        db.add(user)
-                        print(f"✅ Created user: {email}")
-            else:
-                # Create users based on data directories
-                for brand_dir in data_dir.iterdir():
-                    if not brand_dir.is_dir():
-                        continue
-                    
-                    brand = brand_dir.name.lower()
-                    email = f"{brand}_admin@oem.com"
-                    
-                    # Check if user already exists
-                    existing_user = db.query(User).filter(User.email == email).first()
-                    if not existing_user:
-                        user = User(
-                            email=email,
-                            password_hash=hash_password("admin123"),
-                            brand=brand
-                        )
-                        db.add(user)
-                        print(f"✅ Created user: {email}")
-            
+            emails = {f"{brand}_admin@oem.com": brand for brand in _default_brands()}
+
+            started = time.perf_counter()
+            hashes = hash_passwords([DEFAULT_PASSWORD] * len(emails))
+            timings["hash_passwords"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            db.add_all([
+                User(email=email, password_hash=password_hash, brand=emails[email])
+                for email, password_hash in zip(emails, hashes)
+            ])
             db.commit()
+            timings["insert_users"] = time.perf_counter() - started
+
+            for email in emails:
+                print(f"✅ Created user: {email}")
             print("✅ Database initialized successfully!")
         else:
-            print(f"✅ Database already initialized with {user_count} users")
-    
+            print("✅ Database already initialized, skipping default users")
+
     except Exception as e:
         print(f"❌ Error during database initialization: {e}")
         db.rollback()
     finally:
         db.close()
 
-# Run initialization on startup
-init_db()
+    return timings
+
+
+def run_startup() -> dict:
+    """
+    Initialize once per process; the file lock makes concurrent workers wait
+    for the first one and then find the users table already seeded.
+    """
+    global _initialized
+
+    started = time.perf_counter()
+    timings = {}
+
+    if not _initialized:
+        describe_data_dir()
+        with file_lock(STARTUP_LOCK_FILE):
+            timings = init_db()
+
+        hash_started = time.perf_counter()
+        prepare_dummy_hash()
+        timings["dummy_hash"] = time.perf_counter() - hash_started
+
+        # Derived files are validated (and cached) now, not on first request
+        views_started = time.perf_counter()
+        failures = validate_views()
+        timings["validate_views"] = time.perf_counter() - views_started
+        if failures:
+            print(f"⚠️  {len(failures)} invalid data file(s); their endpoints return 500 until fixed")
+        _initialized = True
+
+    total = time.perf_counter() - started
+    report = {
+        "total_seconds": round(total, 4),
+        "budget_seconds": STARTUP_BUDGET_SECONDS,
+        "phases": {name: round(seconds, 4) for name, seconds in timings.items()},
+    }
+
+    phases = ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items())
+    if total > STARTUP_BUDGET_SECONDS:
+        print(f"⚠️  Startup took {total:.3f}s (budget {STARTUP_BUDGET_SECONDS}s): {phases}")
+    else:
+        print(f"✅ Startup took {total:.3f}s: {phases}")
+
+    return report
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.startup_report = run_startup()
+    yield
+    shutdown_pool()
+
+
+app = FastAPI(
+    title="OEM Analytics API",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 # =========================
 # CORS CONFIG
@@ -104,6 +189,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# =========================
+# COMPRESSION
+# =========================
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MIN_BYTES,
+    compresslevel=GZIP_LEVEL,
+    brotli_quality=BROTLI_QUALITY,
+)
+
+# =========================
+# METRICS
+# =========================
+# Outermost, so latency includes compression and CORS handling
+app.add_middleware(MetricsMiddleware)
+
 # =========================
 # HEALTH CHECK
 # =========================
@@ -121,3 +222,9 @@ app.include_router(engine_router)
 app.include_router(battery_router)
 app.include_router(brakes_router)
 app.include_router(mcp_router)
+app.include_router(vehicles_router)
+app.include_router(risk_router)
+app.include_router(timeseries_router)
+app.include_router(telemetry_router)
+app.include_router(dashboard_router)
+app.include_router(metrics_router)
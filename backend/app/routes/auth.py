@@ -1,10 +1,30 @@
+import os
+from typing import NamedTuple
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from app.db import SessionLocal, User
-from app.utils.security import verify_password, create_access_token
+from app.utils.metrics import bcrypt_verify_duration, db_session_duration
+from app.utils.security import (
+    verify_password_async,
+    hash_password_async,
+    needs_rehash,
+    dummy_hash,
+    create_access_token,
+)
+from app.utils.ttl_cache import TTLCache
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Repeat logins read the user from memory. Entries include the password
+# hash and are dropped when this process updates a user, but a password or
+# brand changed by another worker (or directly in the database) is only
+# seen once the entry expires: the old password keeps working for up to
+# USER_CACHE_TTL_SECONDS there, so keep the TTL short (0 disables the cache).
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "1000"))
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "5"))
+
+user_cache = TTLCache(USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL_SECONDS)
+
 
 # ✅ Request schema
 class LoginPayload(BaseModel):
@@ -13,21 +33,100 @@ class LoginPayload(BaseModel):
     brand: str
 
 
-@router.post("/login")
-def login(payload: LoginPayload):
-    db = SessionLocal()
+class UserRecord(NamedTuple):
+    email: str
+    password_hash: str
+    brand: str
+
+
+def _record(user):
+    if user is None:
+        return None
+    return UserRecord(user.email, user.password_hash, user.brand)
+
+
+def _get_user(email: str):
+    # SQLAlchemy is loaded on first login rather than at app import
+    from app.db import SessionLocal, User
+
+    with db_session_duration.time(operation="get_user"):
+        db = SessionLocal()
+        try:
+            return _record(db.query(User).filter(User.email == email).first())
+        finally:
+            db.close()
+
+
+async def _get_user_async(email: str):
+    from sqlalchemy import select
+    from app.db import AsyncSessionLocal, User
+
+    with db_session_duration.time(operation="get_user"):
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(User).where(User.email == email))
+            return _record(result.scalar_one_or_none())
+
 
-    user = db.query(User).filter(User.email == payload.email).first()
-    db.close()
+async def get_user(email: str):
+    """
+    User record by email: from the cache, else through the async engine
+    when an async driver is installed, else on a worker thread.
+    Unknown emails are not cached.
+    """
+    user = user_cache.get(email)
+    if user is not None:
+        return user
+
+    from app.db import AsyncSessionLocal
+
+    if AsyncSessionLocal is not None:
+        user = await _get_user_async(email)
+    else:
+        user = await run_in_threadpool(_get_user, email)
+
+    if user is not None:
+        user_cache.put(email, user)
+    return user
+
+
+def _update_password_hash(email: str, password_hash: str):
+    from app.db import SessionLocal, User
+
+    with db_session_duration.time(operation="update_password_hash"):
+        db = SessionLocal()
+        try:
+            db.query(User).filter(User.email == email).update({"password_hash": password_hash})
+            db.commit()
+        finally:
+            db.close()
+    user_cache.discard(email)
+
+
+async def _verify_password(password: str, password_hash: str) -> bool:
+    with bcrypt_verify_duration.time():
+        return await verify_password_async(password, password_hash)
+
+
+@router.post("/login")
+async def login(payload: LoginPayload):
+    user = await get_user(payload.email)
 
     if not user:
+        # Same bcrypt work as a real account, so response time does not
+        # reveal which emails exist
+        await _verify_password(payload.password, await dummy_hash())
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    if not await _verify_password(payload.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     if user.brand != payload.brand:
         raise HTTPException(status_code=401, detail="Invalid brand selection")
 
-    if not verify_password(payload.password, user.password_hash):
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+    # ✅ Upgrade hashes stored with a different cost factor
+    if needs_rehash(user.password_hash):
+        new_hash = await hash_password_async(payload.password)
+        await run_in_threadpool(_update_password_hash, user.email, new_hash)
 
     token = create_access_token({
         "email": user.email,
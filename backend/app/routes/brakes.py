@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from app.utils.csv_loader import load_csv
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.view_registry import load_view
+from app.utils.http_cache import conditional_get
+from app.utils.responses import cached_json
 from app.utils.auth import get_current_user
 
 router = APIRouter(
@@ -18,67 +21,42 @@ def _ensure_same_brand(url_brand: str, user_brand: str):
 @router.get("/temp-performance")
 def brake_temp_performance(
     brand: str,
-    user=Depends(get_current_user)
+    user=Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
 ):
     print(f"Brakes temp-perf - Brand: {brand}, User: {user}")
     _ensure_same_brand(brand, user["brand"])
+    etag = conditional_get(request, response, [BASE_DATA_DIR / brand.lower() / "brake_temp_perf.csv"])
 
-    rows = load_csv(brand, "brake_temp_perf.csv")
-
-    return [
-        {
-            "temperature": row["temp_band"],
-            # ✅ using YOUR actual column
-            "wear": round(float(row["avg_brake_temp_c"]), 2)
-        }
-        for row in rows
-    ]
+    # temperature/wear pairs from avg_brake_temp_c, built once per file version
+    return cached_json(response, etag, lambda: load_view(brand, "brake_temp_perf.csv"))
 
 
 # ✅ BRAKE WEAR DISTRIBUTION
 @router.get("/wear-distribution")
 def brake_wear_distribution(
     brand: str,
-    user=Depends(get_current_user)
+    user=Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
 ):
     _ensure_same_brand(brand, user["brand"])
+    etag = conditional_get(request, response, [BASE_DATA_DIR / brand.lower() / "brake_wear_distribution.csv"])
 
-    rows = load_csv(brand, "brake_wear_distribution.csv")
-
-    result = []
-    for row in rows:
-        # CSV has duplicate headers, CSV loader keeps only last one
-        # So we must read raw values safely
-        keys = list(row.keys())
-        if len(keys) < 2:
-            continue
-
-        label = list(row.values())[0]
-        value = list(row.values())[1]
-
-        result.append({
-            "label": label,
-            "value": int(value)
-        })
-
-    return result
+    # The duplicated "count,count" header is resolved by position in the registry
+    return cached_json(response, etag, lambda: load_view(brand, "brake_wear_distribution.csv"))
 
 
 # ✅ BRAKE RISK SUMMARY
 @router.get("/risk")
 def brake_risk(
     brand: str,
-    user=Depends(get_current_user)
+    user=Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
 ):
     _ensure_same_brand(brand, user["brand"])
+    etag = conditional_get(request, response, [BASE_DATA_DIR / brand.lower() / "brake_risk_summary.csv"])
 
-    rows = load_csv(brand, "brake_risk_summary.csv")
-    row = rows[0]
-
-    risk_flag = int(row["brake_issue_imminent"])
-    confidence = round(float(row["fraction"]) * 100, 0)
-
-    return {
-        "risk": "High Risk" if risk_flag == 1 else "Low Risk",
-        "confidence": confidence
-    }
+    return cached_json(response, etag, lambda: load_view(brand, "brake_risk_summary.csv"))
@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from app.utils.auth import get_current_user
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.http_cache import conditional_get
+from app.utils.responses import cached_json
+from app.routes.summary import brand_summary
+from app.routes.engine import engine_temp_performance, engine_distribution, engine_risk
+from app.routes.battery import battery_temp_performance, battery_distribution, battery_risk
+from app.routes.brakes import brake_temp_performance, brake_wear_distribution, brake_risk
+
+router = APIRouter(
+    prefix="/{brand}/dashboard",
+    tags=["dashboard"]
+)
+
+# Data files behind each dashboard section
+SECTION_FILES = {
+    "summary": ["master_vehicle_data.csv"],
+    "engine": ["engine_temp_perf.csv", "engine_perf_distribution.csv", "engine_risk_summary.csv"],
+    "battery": ["battery_temp_perf.csv", "battery_health_distribution.csv", "battery_risk_summary.csv"],
+    "brakes": ["brake_temp_perf.csv", "brake_wear_distribution.csv", "brake_risk_summary.csv"],
+}
+
+# Same payloads as the individual endpoints, grouped by dashboard section
+SECTIONS = {
+    "summary": None,
+    "engine": {
+        "temp_performance": engine_temp_performance,
+        "distribution": engine_distribution,
+        "risk": engine_risk,
+    },
+    "battery": {
+        "temp_performance": battery_temp_performance,
+        "distribution": battery_distribution,
+        "risk": battery_risk,
+    },
+    "brakes": {
+        "temp_performance": brake_temp_performance,
+        "wear_distribution": brake_wear_distribution,
+        "risk": brake_risk,
+    },
+}
+
+# Threads shared by all dashboard requests for loading sections concurrently
+_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DASHBOARD_WORKERS", "8")),
+    thread_name_prefix="dashboard"
+)
+
+
+def _ensure_same_brand(url_brand: str, user_brand: str):
+    if url_brand != user_brand:
+        raise HTTPException(
+            status_code=403,
+            detail="Brand mismatch – access denied"
+        )
+
+
+@router.get("")
+def brand_dashboard(
+    brand: str,
+    sections: Optional[str] = Query(None, description="Comma-separated: summary,engine,battery,brakes"),
+    user=Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
+):
+    _ensure_same_brand(brand, user["brand"])
+
+    if sections:
+        wanted = [s.strip() for s in sections.split(",") if s.strip()]
+        unknown = [s for s in wanted if s not in SECTIONS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown sections: {', '.join(unknown)}"
+            )
+    else:
+        wanted = list(SECTIONS)
+
+    brand_dir = BASE_DATA_DIR / brand.lower()
+    etag = conditional_get(
+        request,
+        response,
+        [brand_dir / filename for section in wanted for filename in SECTION_FILES[section]]
+    )
+    return cached_json(response, etag, lambda: _load_sections(brand, user, wanted))
+
+
+def _load_sections(brand: str, user: dict, wanted: list) -> dict:
+    futures = {}
+    for section in wanted:
+        if section == "summary":
+            futures[(section, None)] = _pool.submit(brand_summary, brand, user)
+            continue
+        for part, handler in SECTIONS[section].items():
+            futures[(section, part)] = _pool.submit(handler, brand, user)
+
+    result = {}
+    for (section, part), future in futures.items():
+        payload = future.result()
+        if part is None:
+            result[section] = payload
+        else:
+            result.setdefault(section, {})[part] = payload
+
+    return result
@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from app.utils.csv_loader import load_csv
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.view_registry import load_view
+from app.utils.http_cache import conditional_get
+from app.utils.responses import cached_json
 from app.utils.auth import get_current_user
 
 router = APIRouter(
@@ -22,25 +25,34 @@ def _ensure_same_brand(url_brand: str, user_brand: str):
 @router.get("/temp-performance")
 def engine_temp_performance(
     brand: str,
-    user = Depends(get_current_user)
+    user = Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
 ):
     _ensure_same_brand(brand, user["brand"])
-    return load_csv(brand, "engine_temp_perf.csv")
+    etag = conditional_get(request, response, [BASE_DATA_DIR / brand.lower() / "engine_temp_perf.csv"])
+    return cached_json(response, etag, lambda: load_view(brand, "engine_temp_perf.csv"))
 
 
 @router.get("/distribution")
 def engine_distribution(
     brand: str,
-    user = Depends(get_current_user)
+    user = Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
 ):
     _ensure_same_brand(brand, user["brand"])
-    return load_csv(brand, "engine_perf_distribution.csv")
+    etag = conditional_get(request, response, [BASE_DATA_DIR / brand.lower() / "engine_perf_distribution.csv"])
+    return cached_json(response, etag, lambda: load_view(brand, "engine_perf_distribution.csv"))
 
 
 @router.get("/risk")
 def engine_risk(
     brand: str,
-    user = Depends(get_current_user)
+    user = Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
 ):
     _ensure_same_brand(brand, user["brand"])
-    return load_csv(brand, "engine_risk_summary.csv")
+    etag = conditional_get(request, response, [BASE_DATA_DIR / brand.lower() / "engine_risk_summary.csv"])
+    return cached_json(response, etag, lambda: load_view(brand, "engine_risk_summary.csv"))
@@ -1,77 +1,202 @@
-from fastapi import APIRouter, Depends
+import os
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from app.utils.auth import get_current_user
+from app.utils.insights import get_insights
+from app.utils.intent_router import INTENTS, intent_router
 
 router = APIRouter(prefix="/mcp", tags=["MCP"])
 
+# Questions accepted by one /mcp/batch call
+MCP_BATCH_MAX_QUESTIONS = int(os.getenv("MCP_BATCH_MAX_QUESTIONS", "200"))
+
 class MCPQuery(BaseModel):
     question: str
     brand: str
 
+
+class MCPBatchQuestion(BaseModel):
+    question: str
+    # Answer these sections instead of routing the question
+    sections: Optional[List[str]] = None
+
+
+class MCPBatch(BaseModel):
+    brand: str
+    questions: List[MCPBatchQuestion]
+    # Default sections for questions that do not set their own
+    sections: Optional[List[str]] = None
+
+
+SYSTEM_TITLES = {
+    "engine": "🔧 Engine Health Summary",
+    "battery": "🔋 Battery Health Summary",
+    "brakes": "🛑 Brake System Summary",
+}
+
+# What the distribution buckets measure, per system
+DISTRIBUTION_LABELS = {
+    "engine": "engine performance",
+    "battery": "battery health",
+    "brakes": "brake wear",
+}
+
+RISK_ADVICE = {
+    "LOW": "No action needed beyond scheduled maintenance.",
+    "MODERATE": "Prioritise inspection of the flagged vehicles.",
+    "HIGH": "Flagged vehicles need immediate attention.",
+}
+
+
+def _percent(fraction: float) -> str:
+    return f"{fraction * 100:.2f}%"
+
+
+def _system_answer(brand: str, system: str, insights: dict) -> str:
+    data = insights[system]
+    lines = [
+        f"{SYSTEM_TITLES[system]} for {brand}:",
+        f"• {_percent(data['flagged_fraction'])} of readings flagged for imminent failure "
+        f"({data['risk_level']} risk).",
+    ]
+
+    bands = data["temperature_bands"]
+    if bands:
+        lines.append(
+            f"• Range across temperature bands: {bands['low']['value']:.2f} ({bands['low']['band']}) "
+            f"to {bands['high']['value']:.2f} ({bands['high']['band']})."
+        )
+
+    dominant = data["dominant_bucket"]
+    if dominant:
+        lines.append(
+            f"• Most common {DISTRIBUTION_LABELS[system]} bucket: {dominant['label']} "
+            f"({_percent(dominant['share'])} of readings)."
+        )
+
+    lines.append(f"• {RISK_ADVICE[data['risk_level']]}")
+    return "\n".join(lines)
+
+
+def _ranking_answer(brand: str, insights: dict) -> str:
+    ranking = insights["ranking"]
+    summary = insights["summary"]
+    lines = [
+        f"🏆 Global Ranking Insight for {brand}:",
+        f"• Ranked #{ranking['rank']} of {ranking['total_brands']} brands "
+        f"with a fleet health score of {summary['fleet_health_score']:.2f}.",
+    ]
+
+    leader = ranking["leader"]
+    if ranking["rank"] == 1:
+        lines.append("• Leads all brands on fleet health.")
+    else:
+        lines.append(
+            f"• {leader['brand'].upper()} leads with {leader['score']:.2f} "
+            f"({leader['score'] - summary['fleet_health_score']:.2f} points ahead)."
+        )
+    return "\n".join(lines)
+
+
+def _summary_answer(brand: str, insights: dict) -> str:
+    summary = insights["summary"]
+    at_risk = [
+        system for system in SYSTEM_TITLES
+        if insights[system]["risk_level"] != "LOW"
+    ]
+    return "\n".join([
+        f"📊 Overall Fleet Summary for {brand}:",
+        f"• Fleet health is rated {summary['status']} ({summary['fleet_health_score']:.1f}/100).",
+        f"• Engine {summary['engine_health']:.1f}%, battery {summary['battery_health']:.1f}%, "
+        f"brakes {summary['brake_health']:.1f}% healthy across {summary['records']:,} readings.",
+        f"• Elevated risk in: {', '.join(at_risk)}." if at_risk
+        else "• No elevated risks across engine, battery or brakes.",
+    ])
+
+
+HELP_ANSWER = (
+    "I can provide insights on:\n"
+    "• Engine health\n"
+    "• Battery performance\n"
+    "• Brake wear\n"
+    "• Fleet summary\n"
+    "• Global ranking"
+)
+
+
+def _section_answer(brand: str, section: str, insights: dict) -> str:
+    if section == "ranking":
+        return _ranking_answer(brand, insights)
+    if section == "summary":
+        return _summary_answer(brand, insights)
+    return _system_answer(brand, section, insights)
+
+
+def answer(brand: str, sections: list, insights: dict) -> str:
+    """
+    Answer text for the given sections, all read from one insight bundle.
+    """
+    if not sections:
+        return HELP_ANSWER
+    if insights is None:
+        return f"No analytics data is available for {brand.upper()} yet."
+    return "\n\n".join(_section_answer(brand.upper(), section, insights) for section in sections)
+
+
+def _check_sections(sections: Optional[list]):
+    unknown = sorted(set(sections or ()) - set(INTENTS))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown sections: {', '.join(unknown)}. Available: {', '.join(INTENTS)}"
+        )
+
+
 @router.post("/query")
 def mcp_query(payload: MCPQuery, user=Depends(get_current_user)):
     if payload.brand != user["brand"]:
         return {"answer": "You can only query your own brand data."}
 
-    q = payload.question.lower()
-    brand = payload.brand.upper()
-
-    if "engine" in q:
-        return {
-            "answer": (
-                f"🔧 Engine Health Summary for {brand}:\n"
-                "• Engine performance is stable across all temperature bands.\n"
-                "• No imminent engine failure detected.\n"
-                "• Fleet shows high reliability under normal operating conditions."
-            )
-        }
-
-    if "battery" in q:
-        return {
-            "answer": (
-                f"🔋 Battery Health Summary for {brand}:\n"
-                "• Battery health remains in the 80–100% range for most vehicles.\n"
-                "• Performance is consistent across temperature variations.\n"
-                "• Low probability of battery failure in the near term."
-            )
-        }
-
-    if "brake" in q:
-        return {
-            "answer": (
-                f"🛑 Brake System Summary for {brand}:\n"
-                "• Brake wear is within acceptable thresholds.\n"
-                "• No critical brake failure risks identified.\n"
-                "• Preventive maintenance is recommended as per schedule."
-            )
-        }
-
-    if "ranking" in q or "rank" in q:
-        return {
-            "answer": (
-                f"🏆 Global Ranking Insight for {brand}:\n"
-                "• Brand ranks competitively based on fleet health score.\n"
-                "• Strong performance compared to industry peers."
-            )
-        }
-
-    if "fleet" in q or "summary" in q or "overall" in q:
-        return {
-            "answer": (
-                f"📊 Overall Fleet Summary for {brand}:\n"
-                "• Fleet health is rated GOOD.\n"
-                "• No critical risks detected across engine, battery or brakes.\n"
-                "• Operational stability is high."
-            )
-        }
+    sections = intent_router.route(payload.question)
+    insights = get_insights(payload.brand) if sections else None
+    return {"answer": answer(payload.brand, sections, insights)}
 
-    return {
-        "answer": (
-            "I can provide insights on:\n"
-            "• Engine health\n"
-            "• Battery performance\n"
-            "• Brake wear\n"
-            "• Fleet summary\n"
-            "• Global ranking"
+
+@router.post("/batch")
+def mcp_batch(payload: MCPBatch, user=Depends(get_current_user)):
+    """
+    Answer many questions in one call. Every answer comes from the same
+    insight bundle, so a batch never mixes two data versions.
+    """
+    if payload.brand != user["brand"]:
+        raise HTTPException(
+            status_code=403,
+            detail="Brand mismatch – access denied"
+        )
+    if len(payload.questions) > MCP_BATCH_MAX_QUESTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MCP_BATCH_MAX_QUESTIONS} questions per batch"
         )
+
+    _check_sections(payload.sections)
+    for item in payload.questions:
+        _check_sections(item.sections)
+
+    insights = get_insights(payload.brand)
+
+    answers = []
+    for item in payload.questions:
+        sections = item.sections or payload.sections or intent_router.route(item.question)
+        answers.append({
+            "question": item.question,
+            "sections": sections,
+            "answer": answer(payload.brand, sections, insights),
+        })
+
+    return {
+        "brand": payload.brand,
+        "total_questions": len(answers),
+        "answers": answers,
     }
@@ -0,0 +1,69 @@
+import hmac
+import os
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from app.routes.auth import user_cache
+from app.utils import metrics
+from app.utils.auth import token_cache
+from app.utils.brand_stats import compare_cache_stats
+from app.utils.csv_loader import cache_stats
+from app.utils.insights import insights_cache_stats
+from app.utils.responses import serialized_cache_stats
+from app.utils.risk_scoring import risk_cache_stats
+from app.utils.shared_store import attach_stats
+from app.utils.timeseries import timeseries_cache_stats
+from app.utils.vehicle_index import index_cache_stats
+from app.utils.view_registry import view_cache_stats
+
+router = APIRouter(tags=["metrics"])
+
+# When set, scrapers must send "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+CACHES = {
+    "dataset": cache_stats,
+    "token": token_cache.stats,
+    "users": user_cache.stats,
+    "derived_views": view_cache_stats,
+    "serialized_responses": serialized_cache_stats,
+    "shared_store": attach_stats,
+    "vehicle_index": index_cache_stats,
+    "mcp_insights": insights_cache_stats,
+    "vehicle_risk": risk_cache_stats,
+    "brand_stats": compare_cache_stats,
+    "timeseries": timeseries_cache_stats,
+}
+
+
+def _cache_lines() -> list:
+    series = {
+        "cache_hits_total": ("counter", "Cache lookups served from memory.", "hits"),
+        "cache_misses_total": ("counter", "Cache lookups that had to build or load.", "misses"),
+        "cache_hit_ratio": ("gauge", "Hits / lookups since process start.", "hit_ratio"),
+        "cache_entries": ("gauge", "Entries currently held.", "entries"),
+    }
+    stats = {name: collect() for name, collect in CACHES.items()}
+
+    lines = []
+    for metric, (kind, documentation, field) in series.items():
+        lines.append(f"# HELP {metric} {documentation}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for cache, values in stats.items():
+            lines.append(f'{metric}{{cache="{cache}"}} {values[field]}')
+    return lines
+
+
+metrics.register_collector(_cache_lines)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics(request: Request):
+    if METRICS_TOKEN:
+        supplied = request.headers.get("authorization", "")
+        if not hmac.compare_digest(supplied, f"Bearer {METRICS_TOKEN}"):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+    return PlainTextResponse(
+        metrics.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
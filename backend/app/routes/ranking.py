@@ -1,18 +1,23 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from app.utils.auth import get_current_user
-import pandas as pd
 from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.aggregates import ranking_payload
+from app.utils.brand_stats import compare_brands, parse_stats
+from app.utils.http_cache import conditional_get
+from app.utils.responses import cached_json
 
 router = APIRouter(prefix="/ranking", tags=["ranking"])
 
 @router.get("")
-def brand_ranking(user = Depends(get_current_user)):
+def brand_ranking(
+    user = Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
+):
     """
     Global brand ranking.
     Accessible to any authenticated user.
     """
-    results = []
-
     # Check if data directory exists
     if not BASE_DATA_DIR.exists():
         return {
@@ -20,39 +25,29 @@ def brand_ranking(user = Depends(get_current_user)):
             "ranking": []
         }
 
-    for brand_dir in BASE_DATA_DIR.iterdir():
-        if not brand_dir.is_dir():
-            continue
-
-        brand = brand_dir.name.lower()
-        master_file = brand_dir / "master_vehicle_data.csv"
-
-        if not master_file.exists():
-            continue
-
-        df = pd.read_csv(master_file)
-
-        engine_risk = df["engine_failure_imminent"].mean()
-        battery_risk = df["battery_issue_imminent"].mean()
-        brake_risk = df["brake_issue_imminent"].mean()
-
-        fleet_health = 100 * (1 - (engine_risk + battery_risk + brake_risk) / 3)
+    etag = conditional_get(request, response, list(BASE_DATA_DIR.glob("*/master_vehicle_data.csv")))
+    return cached_json(response, etag, ranking_payload)
 
-        results.append({
-            "brand": brand,
-            "fleet_health_score": round(fleet_health, 2),
-            "engine_health": round(100 * (1 - engine_risk), 2),
-            "battery_health": round(100 * (1 - battery_risk), 2),
-            "brake_health": round(100 * (1 - brake_risk), 2),
-            "total_vehicles": int(len(df)),
-        })
 
-    results.sort(key=lambda x: x["fleet_health_score"], reverse=True)
-
-    for idx, row in enumerate(results, start=1):
-        row["rank"] = idx
-
-    return {
-        "total_brands": len(results),
-        "ranking": results
-    }
+@router.get("/compare")
+def compare_brands_view(
+    metrics: str = Query(..., description="Comma-separated master columns, e.g. engine_temp_c,brake_pad_wear_mm"),
+    stats: str = Query("mean", description="Comma-separated: count,mean,std,min,max,median,p<0-100>"),
+    user = Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
+):
+    """
+    Per-brand statistics of any numeric telemetry column.
+    Accessible to any authenticated user.
+    """
+    wanted = list(dict.fromkeys(m.strip() for m in metrics.split(",") if m.strip()))
+    wanted_stats = parse_stats(list(dict.fromkeys(s.strip() for s in stats.split(",") if s.strip())))
+    if not wanted or not wanted_stats:
+        raise HTTPException(
+            status_code=400,
+            detail="At least one metric and one stat are required"
+        )
+
+    etag = conditional_get(request, response, list(BASE_DATA_DIR.glob("*/master_vehicle_data.csv")))
+    return cached_json(response, etag, lambda: compare_brands(wanted, wanted_stats))
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from app.utils.auth import get_current_user
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.http_cache import conditional_get
+from app.utils.responses import cached_json
+from app.utils.risk_scoring import vehicles_at_risk
+
+router = APIRouter(
+    prefix="/{brand}/risk",
+    tags=["risk"]
+)
+
+
+def _ensure_same_brand(url_brand: str, user_brand: str):
+    if url_brand != user_brand:
+        raise HTTPException(
+            status_code=403,
+            detail="Brand mismatch – access denied"
+        )
+
+
+# ✅ VEHICLES RANKED BY RISK
+@router.get("/vehicles")
+def risky_vehicles(
+    brand: str,
+    top: int = Query(20, ge=1, le=1000),
+    user=Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
+):
+    _ensure_same_brand(brand, user["brand"])
+
+    etag = conditional_get(request, response, [BASE_DATA_DIR / brand.lower() / "master_vehicle_data.csv"])
+    return cached_json(response, etag, lambda: vehicles_at_risk(brand, top))
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-import pandas as pd
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.aggregates import aggregate_store
+from app.utils.http_cache import conditional_get
+from app.utils.responses import cached_json
 from app.utils.auth import get_current_user
 
 router = APIRouter(
@@ -20,7 +22,9 @@ def _ensure_same_brand(url_brand: str, user_brand: str):
 @router.get("")
 def brand_summary(
     brand: str,
-    user = Depends(get_current_user)
+    user = Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
 ):
     # security check
     _ensure_same_brand(brand, user["brand"])
@@ -33,19 +37,28 @@ def brand_summary(
             status_code=404,
             detail=f"Data not available for brand '{brand}'"
         )
-    
-    df = pd.read_csv(path / "master_vehicle_data.csv")
 
-    engine_risk = df["engine_failure_imminent"].mean()
-    battery_risk = df["battery_issue_imminent"].mean()
-    brake_risk = df["brake_issue_imminent"].mean()
+    etag = conditional_get(request, response, [path / "master_vehicle_data.csv"])
+    return cached_json(response, etag, lambda: _summary_payload(brand))
+
+
+def _summary_payload(brand: str) -> dict:
+    agg = aggregate_store.get(brand)
+
+    if agg is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Data not available for brand '{brand}'"
+        )
+
+    engine_risk = agg["engine_risk"]
+    battery_risk = agg["battery_risk"]
+    brake_risk = agg["brake_risk"]
 
     return {
-        "fleet_health_score": round(
-            100 * (1 - (engine_risk + battery_risk + brake_risk) / 3), 1
-        ),
+        "fleet_health_score": round(agg["fleet_health"], 1),
         "engine_health": round(100 * (1 - engine_risk), 1),
         "battery_health": round(100 * (1 - battery_risk), 1),
         "brake_health": round(100 * (1 - brake_risk), 1),
-        "total_vehicles": int(len(df))
+        "total_vehicles": agg["total_vehicles"]
     }
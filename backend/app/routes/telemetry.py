@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Optional
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.utils.auth import get_current_user
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+router = APIRouter(
+    prefix="/{brand}/telemetry",
+    tags=["telemetry"]
+)
+
+MASTER_FILE = "master_vehicle_data.csv"
+
+# Rows parsed per chunk while streaming
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "50000"))
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _ensure_same_brand(url_brand: str, user_brand: str):
+    if url_brand != user_brand:
+        raise HTTPException(
+            status_code=403,
+            detail="Brand mismatch – access denied"
+        )
+
+
+def _stream_rows(path, columns, fmt, start, end):
+    """
+    Yield the export body chunk by chunk; only one chunk is in memory.
+    """
+    filter_time = start is not None or end is not None
+    usecols = columns
+    if filter_time and "timestamp" not in columns:
+        usecols = columns + ["timestamp"]
+
+    if fmt == "csv":
+        yield pd.DataFrame(columns=columns).to_csv(index=False)
+
+    for chunk in pd.read_csv(path, usecols=usecols, chunksize=EXPORT_CHUNK_ROWS):
+        if filter_time:
+            ts = pd.to_datetime(chunk["timestamp"])
+            mask = pd.Series(True, index=chunk.index)
+            if start is not None:
+                mask &= ts >= pd.Timestamp(start)
+            if end is not None:
+                mask &= ts <= pd.Timestamp(end)
+            chunk = chunk[mask]
+
+        if chunk.empty:
+            continue
+
+        chunk = chunk[columns]
+        if fmt == "csv":
+            yield chunk.to_csv(index=False, header=False)
+        else:
+            body = chunk.to_json(orient="records", lines=True, force_ascii=False)
+            yield body if body.endswith("\n") else body + "\n"
+
+
+# ✅ RAW TELEMETRY EXPORT
+@router.get("/export")
+def export_telemetry(
+    brand: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    columns: Optional[str] = Query(None, description="Comma-separated column list"),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    user=Depends(get_current_user)
+):
+    _ensure_same_brand(brand, user["brand"])
+
+    path = BASE_DATA_DIR / brand.lower() / MASTER_FILE
+
+    if not path.exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"Data not available for brand '{brand}'"
+        )
+
+    available = list(pd.read_csv(path, nrows=0).columns)
+
+    if columns:
+        selected = [c.strip() for c in columns.split(",") if c.strip()]
+        unknown = [c for c in selected if c not in available]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown columns: {', '.join(unknown)}"
+            )
+    else:
+        selected = available
+
+    # Timezone-aware bounds are compared in UTC against naive timestamps
+    if start is not None and start.tzinfo is not None:
+        start = pd.Timestamp(start).tz_convert("UTC").tz_localize(None)
+    if end is not None and end.tzinfo is not None:
+        end = pd.Timestamp(end).tz_convert("UTC").tz_localize(None)
+
+    return StreamingResponse(
+        _stream_rows(path, selected, format, start, end),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{brand.lower()}_telemetry.{format}"'
+        }
+    )
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from app.utils.auth import get_current_user
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.http_cache import conditional_get
+from app.utils.responses import cached_json
+from app.utils.timeseries import get_timeseries
+
+router = APIRouter(
+    prefix="/{brand}/timeseries",
+    tags=["timeseries"]
+)
+
+
+def _ensure_same_brand(url_brand: str, user_brand: str):
+    if url_brand != user_brand:
+        raise HTTPException(
+            status_code=403,
+            detail="Brand mismatch – access denied"
+        )
+
+
+# ✅ DOWNSAMPLED SENSOR HISTORY
+@router.get("")
+def sensor_timeseries(
+    brand: str,
+    column: str = Query(..., description="Numeric master column, e.g. engine_temp_c"),
+    vehicle_id: Optional[str] = Query(None, description="One vehicle (default: the whole fleet)"),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    points: int = Query(500, ge=1, le=5000),
+    method: str = Query("buckets", description="buckets (mean/min/max per time bucket) or lttb"),
+    user=Depends(get_current_user),
+    request: Request = None,
+    response: Response = None
+):
+    _ensure_same_brand(brand, user["brand"])
+
+    etag = conditional_get(request, response, [BASE_DATA_DIR / brand.lower() / "master_vehicle_data.csv"])
+    return cached_json(
+        response,
+        etag,
+        lambda: get_timeseries(brand, column, vehicle_id, start, end, points, method),
+    )
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.utils.auth import get_current_user
+from app.utils.responses import FastJSONResponse
+from app.utils.vehicle_index import get_vehicle_index
+
+router = APIRouter(
+    prefix="/{brand}/vehicles",
+    tags=["vehicles"]
+)
+
+
+def _ensure_same_brand(url_brand: str, user_brand: str):
+    if url_brand != user_brand:
+        raise HTTPException(
+            status_code=403,
+            detail="Brand mismatch – access denied"
+        )
+
+
+# ✅ VEHICLES IN FLEET
+@router.get("")
+def list_vehicles(
+    brand: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    user=Depends(get_current_user)
+):
+    _ensure_same_brand(brand, user["brand"])
+
+    index = get_vehicle_index(brand)
+
+    return {
+        "total": len(index),
+        "offset": offset,
+        "limit": limit,
+        "vehicles": index.vehicles(offset, limit)
+    }
+
+
+# ✅ TELEMETRY FOR ONE VEHICLE
+@router.get("/{vehicle_id}")
+def vehicle_telemetry(
+    brand: str,
+    vehicle_id: str,
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=5000),
+    user=Depends(get_current_user)
+):
+    _ensure_same_brand(brand, user["brand"])
+
+    index = get_vehicle_index(brand)
+    bounds = index.row_range(vehicle_id, start, end)
+
+    if bounds is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Vehicle '{vehicle_id}' not found for brand '{brand}'"
+        )
+
+    first, last = bounds
+    page_start = min(first + offset, last)
+    page_end = min(page_start + limit, last)
+
+    # Returned as a response so the rows skip jsonable_encoder
+    return FastJSONResponse({
+        "vehicle_id": vehicle_id,
+        "total": last - first,
+        "offset": offset,
+        "limit": limit,
+        "rows": index.rows(page_start, page_end)
+    })
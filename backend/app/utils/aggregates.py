@@ -0,0 +1,128 @@
+import threading
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.columnar import table_version
+from app.utils.shared_store import attach
+
+MASTER_TABLE = "master_vehicle_data"
+
+FLAG_COLUMNS = [
+    "engine_failure_imminent",
+    "battery_issue_imminent",
+    "brake_issue_imminent",
+]
+
+
+def compute_brand_aggregate(brand: str, data_dir) -> dict:
+    """
+    Fleet risk means and vehicle count for one brand's master telemetry.
+    Only the three flag columns are read, from the shared memory-mapped copy.
+    """
+    cols = attach(brand, FLAG_COLUMNS, data_dir=data_dir)
+
+    engine_risk = float(cols["engine_failure_imminent"].mean())
+    battery_risk = float(cols["battery_issue_imminent"].mean())
+    brake_risk = float(cols["brake_issue_imminent"].mean())
+
+    return {
+        "engine_risk": engine_risk,
+        "battery_risk": battery_risk,
+        "brake_risk": brake_risk,
+        "fleet_health": 100 * (1 - (engine_risk + battery_risk + brake_risk) / 3),
+        "total_vehicles": int(len(cols["engine_failure_imminent"])),
+    }
+
+
+class FleetAggregateStore:
+    """
+    In-memory fleet health aggregates per brand.
+
+    Each brand is recomputed only when its master data version changes, so
+    /ranking and /{brand}/summary are served without re-reading telemetry.
+    """
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self._brands = {}
+        self._lock = threading.Lock()
+
+    def get(self, brand: str):
+        """
+        Aggregate for one brand, or None when it has no master data.
+        """
+        brand = brand.lower()
+
+        try:
+            version = table_version(brand, MASTER_TABLE, self.data_dir)
+        except FileNotFoundError:
+            with self._lock:
+                self._brands.pop(brand, None)
+            return None
+
+        with self._lock:
+            entry = self._brands.get(brand)
+        if entry is not None and entry["version"] == version:
+            return entry["aggregate"]
+
+        aggregate = compute_brand_aggregate(brand, self.data_dir)
+        with self._lock:
+            self._brands[brand] = {"version": version, "aggregate": aggregate}
+        return aggregate
+
+    def all_brands(self) -> dict:
+        """
+        Aggregates for every brand directory that has master data.
+        """
+        if not self.data_dir.exists():
+            return {}
+
+        results = {}
+        for brand_dir in self.data_dir.iterdir():
+            if not brand_dir.is_dir():
+                continue
+
+            brand = brand_dir.name.lower()
+            aggregate = self.get(brand)
+            if aggregate is not None:
+                results[brand] = aggregate
+
+        # Forget brands whose directories were removed
+        with self._lock:
+            for brand in list(self._brands):
+                if brand not in results:
+                    del self._brands[brand]
+
+        return results
+
+
+aggregate_store = FleetAggregateStore(BASE_DATA_DIR)
+
+
+def ranking_payload() -> dict:
+    """
+    Brands ranked by fleet health, as served by /ranking and the MCP tools.
+    """
+    results = []
+
+    for brand, agg in aggregate_store.all_brands().items():
+        engine_risk = agg["engine_risk"]
+        battery_risk = agg["battery_risk"]
+        brake_risk = agg["brake_risk"]
+
+        results.append({
+            "brand": brand,
+            "fleet_health_score": round(agg["fleet_health"], 2),
+            "engine_health": round(100 * (1 - engine_risk), 2),
+            "battery_health": round(100 * (1 - battery_risk), 2),
+            "brake_health": round(100 * (1 - brake_risk), 2),
+            "total_vehicles": agg["total_vehicles"],
+        })
+
+    results.sort(key=lambda x: x["fleet_health_score"], reverse=True)
+
+    for idx, row in enumerate(results, start=1):
+        row["rank"] = idx
+
+    return {
+        "total_brands": len(results),
+        "ranking": results
+    }
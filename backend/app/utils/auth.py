@@ -1,32 +1,102 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
+from jose import JWTError
+import logging
+import os
+import threading
+import time
+from app.utils.lazy import lazy_import
+from app.utils.metrics import jwt_decode_duration
 from app.utils.security import SECRET_KEY, ALGORITHM
+from app.utils.ttl_cache import TTLCache
+
+jwt = lazy_import("jose.jwt")
 
 security = HTTPBearer()
 
+logger = logging.getLogger(__name__)
+
+# Verified tokens kept in memory so repeat requests skip HMAC + JSON decode
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+# Upper bound on how long a verified token is trusted without re-checking
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+# At most this many auth-failure log lines per window
+AUTH_FAILURE_LOG_LIMIT = int(os.getenv("AUTH_FAILURE_LOG_LIMIT", "10"))
+AUTH_FAILURE_LOG_WINDOW_SECONDS = 60
+
+
+# Entries also drop at the token's own exp, so a cached token is never
+# accepted past its expiry
+token_cache = TTLCache(TOKEN_CACHE_MAX_ENTRIES, TOKEN_CACHE_TTL_SECONDS)
+
+
+class _FailureLog:
+    """
+    Rate-limited warning for rejected tokens. Never logs the token itself.
+    """
+
+    def __init__(self, limit: int, window_seconds: int):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._window_start = 0.0
+        self._logged = 0
+        self._suppressed = 0
+
+    def record(self, reason: str):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window_start >= self.window_seconds:
+                suppressed = self._suppressed
+                self._window_start = now
+                self._logged = 0
+                self._suppressed = 0
+            else:
+                suppressed = 0
+
+            if self._logged >= self.limit:
+                self._suppressed += 1
+                return
+            self._logged += 1
+
+        logger.warning(
+            "auth.token_rejected reason=%s suppressed_since_last_window=%d",
+            reason,
+            suppressed,
+        )
+
+
+_failure_log = _FailureLog(AUTH_FAILURE_LOG_LIMIT, AUTH_FAILURE_LOG_WINDOW_SECONDS)
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     token = credentials.credentials
 
+    # ✅ Fast path: token already verified and not yet expired
+    user = token_cache.get(token)
+    if user is not None:
+        return dict(user)
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        with jwt_decode_duration.time():
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError as e:
+        _failure_log.record(type(e).__name__)
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-        # ✅ FIX
-        email = payload.get("email")
-        brand = payload.get("brand")
+    email = payload.get("email")
+    brand = payload.get("brand")
 
-        if not email or not brand:
-            raise HTTPException(status_code=401, detail="Invalid token payload")
+    if not email or not brand:
+        _failure_log.record("missing_claims")
+        raise HTTPException(status_code=401, detail="Invalid token payload")
 
-        return {
-            "email": email,
-            "brand": brand
-        }
+    user = {
+        "email": email,
+        "brand": brand
+    }
+    token_cache.put(token, user, payload.get("exp"))
 
-    except JWTError as e:
-        print(f"JWT Error: {e}")
-        print(f"Token: {token[:50]}...")
-        print(f"SECRET_KEY: {SECRET_KEY[:20]}...")
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    return dict(user)
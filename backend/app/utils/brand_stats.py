@@ -0,0 +1,217 @@
+import csv
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from fastapi import HTTPException
+from app.utils.csv_loader import BASE_DATA_DIR, file_version
+from app.utils.lazy import lazy_import
+from app.utils.master_schema import CATEGORY_COLUMNS, TIMESTAMP_COLUMNS
+from app.utils.shared_store import MASTER_TABLE, attach
+from app.utils.versioned_cache import VersionedCache
+
+np = lazy_import("numpy")
+
+# Per-brand statistics over any numeric master column. Each statistic is cached
+# per (brand, column, stat) and master data version; the missing ones are
+# computed one task per brand on a process pool, and every task maps only the
+# columns it needs from the shared store.
+
+# Worker processes for cross-brand statistics (1 = compute in the request)
+COMPARE_POOL_SIZE = int(os.getenv("COMPARE_POOL_SIZE", str(os.cpu_count() or 1)))
+COMPARE_CACHE_MAX_ENTRIES = int(os.getenv("COMPARE_CACHE_MAX_ENTRIES", "4096"))
+
+NAMED_STATS = ("count", "mean", "std", "min", "max", "median")
+# Percentiles are requested as p<0-100>, e.g. p95 or p99.9
+_PERCENTILE = re.compile(r"^p(\d{1,2}(\.\d+)?|100)$")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+_stats = VersionedCache(max_entries=COMPARE_CACHE_MAX_ENTRIES)
+_MISSING = object()
+
+
+def parse_stats(names: list) -> list:
+    unknown = [name for name in names if name not in NAMED_STATS and not _PERCENTILE.match(name)]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown stats: {', '.join(unknown)}. Use {', '.join(NAMED_STATS)} or p<0-100>"
+        )
+    return names
+
+
+def _compute(values: "np.ndarray", stats: list) -> dict:
+    values = np.asarray(values, dtype="float64")
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {stat: (0 if stat == "count" else None) for stat in stats}
+
+    percentiles = [stat for stat in stats if stat == "median" or stat.startswith("p")]
+    qs = [50.0 if stat == "median" else float(stat[1:]) for stat in percentiles]
+    found = dict(zip(percentiles, np.percentile(values, qs))) if qs else {}
+
+    result = {}
+    for stat in stats:
+        if stat == "count":
+            result[stat] = int(len(values))
+        elif stat == "mean":
+            result[stat] = float(values.mean())
+        elif stat == "std":
+            result[stat] = float(values.std())
+        elif stat == "min":
+            result[stat] = float(values.min())
+        elif stat == "max":
+            result[stat] = float(values.max())
+        else:
+            result[stat] = float(found[stat])
+    return result
+
+
+class BrandStatsError(Exception):
+    """
+    An HTTPException raised in a pool worker. HTTPException does not survive
+    pickling, so its status and detail travel in the exception args.
+    """
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def brand_column_stats(brand: str, data_dir: str, wanted: dict) -> dict:
+    """
+    {column: {stat: value}} for one brand; `wanted` maps column -> stats.
+    Runs in a pool worker, so failures are raised as BrandStatsError.
+    """
+    try:
+        columns = attach(brand, list(wanted), data_dir=Path(data_dir))
+    except HTTPException as e:
+        raise BrandStatsError(e.status_code, e.detail)
+    return {name: _compute(columns[name], stats) for name, stats in wanted.items()}
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=COMPARE_POOL_SIZE)
+    return _pool
+
+
+def shutdown_pool():
+    """
+    Stop the worker processes, if any were started (called at app shutdown).
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _brand_csvs() -> dict:
+    if not BASE_DATA_DIR.exists():
+        return {}
+    return {
+        path.parent.name: path
+        for path in sorted(BASE_DATA_DIR.glob(f"*/{MASTER_TABLE}.csv"))
+    }
+
+
+def _header(path: Path) -> list:
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def check_metrics(metrics: list, headers: dict):
+    non_numeric = [m for m in metrics if m in CATEGORY_COLUMNS or m in TIMESTAMP_COLUMNS]
+    if non_numeric:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Not numeric columns: {', '.join(non_numeric)}"
+        )
+
+    known = set().union(*headers.values())
+    unknown = [m for m in metrics if m not in known]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown columns: {', '.join(unknown)}"
+        )
+
+
+def compare_brands(metrics: list, stats: list) -> dict:
+    """
+    Requested statistics of every brand, computing only what is not cached.
+    """
+    csvs = _brand_csvs()
+    headers = {brand: set(_header(path)) for brand, path in csvs.items()}
+    check_metrics(metrics, headers)
+
+    versions = {brand: file_version(path) for brand, path in csvs.items()}
+
+    results = {brand: {} for brand in csvs}
+    todo = {}
+    for brand in csvs:
+        for column in metrics:
+            if column not in headers[brand]:
+                results[brand][column] = None
+                continue
+            results[brand][column] = {}
+            for stat in stats:
+                value = _stats.get((brand, column, stat), versions[brand], _MISSING)
+                if value is _MISSING:
+                    todo.setdefault(brand, {}).setdefault(column, []).append(stat)
+                else:
+                    results[brand][column][stat] = value
+
+    if todo:
+        for brand, computed in _run(todo).items():
+            for column, values in computed.items():
+                for stat, value in values.items():
+                    _stats.put((brand, column, stat), versions[brand], value)
+                    results[brand][column][stat] = value
+
+    return {
+        "metrics": metrics,
+        "stats": stats,
+        "total_brands": len(results),
+        "brands": [
+            {"brand": brand, "metrics": values}
+            for brand, values in results.items()
+        ],
+    }
+
+
+def _run(todo: dict) -> dict:
+    data_dir = str(BASE_DATA_DIR)
+    try:
+        if COMPARE_POOL_SIZE <= 1 or len(todo) <= 1:
+            return {
+                brand: brand_column_stats(brand, data_dir, wanted)
+                for brand, wanted in todo.items()
+            }
+
+        pool = _get_pool()
+        futures = {
+            brand: pool.submit(brand_column_stats, brand, data_dir, wanted)
+            for brand, wanted in todo.items()
+        }
+        return {brand: future.result() for brand, future in futures.items()}
+    except BrandStatsError as e:
+        # Keeps client errors (e.g. a column the shared store does not hold) as 4xx
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            # A worker died; the next request starts a fresh pool
+            shutdown_pool()
+        raise HTTPException(status_code=500, detail=f"Brand statistics failed: {e}")
+
+
+def compare_cache_stats() -> dict:
+    return _stats.stats()
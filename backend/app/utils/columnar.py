@@ -0,0 +1,188 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from fastapi import HTTPException
+from app.utils.csv_loader import BASE_DATA_DIR, file_version
+from app.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# Converted tables live next to their CSVs:
+#   data/processed/<brand>/columnar/<table>/manifest.json + one .npy per column
+COLUMNAR_DIRNAME = "columnar"
+MANIFEST_FILE = "manifest.json"
+FORMAT_VERSION = 1
+
+
+def columnar_dir(brand: str, table: str, data_dir: Path = None) -> Path:
+    data_dir = data_dir or BASE_DATA_DIR
+    return data_dir / brand.lower() / COLUMNAR_DIRNAME / table
+
+
+def _column_array(series: "pd.Series") -> "np.ndarray":
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_datetime64_dtype(series.dtype):
+        return series.to_numpy()
+
+    if series.isna().any():
+        # Strings with gaps keep their nulls as an object array (not mmap-able)
+        return series.to_numpy(dtype=object)
+
+    # Fixed-width unicode, so the column can be memory mapped
+    return series.to_numpy(dtype=str)
+
+
+def convert_csv(csv_path: Path, out_dir: Path) -> dict:
+    """
+    Convert one CSV into a directory of .npy columns plus a manifest.
+    """
+    source_version = file_version(csv_path)
+    return write_columns(pd.read_csv(csv_path), out_dir, csv_path, source_version)
+
+
+def write_columns(df: "pd.DataFrame", out_dir: Path, csv_path: Path, source_version) -> dict:
+    """
+    Write a frame parsed from csv_path as .npy columns plus a manifest.
+    The directory is replaced atomically so readers never see half a table.
+    """
+    tmp_dir = out_dir.with_name(out_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    columns = []
+    for idx, name in enumerate(df.columns):
+        arr = _column_array(df[name])
+        filename = f"{idx:03d}.npy"
+        np.save(tmp_dir / filename, arr, allow_pickle=arr.dtype == object)
+        columns.append({
+            "name": name,
+            "file": filename,
+            "dtype": arr.dtype.str,
+        })
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "source": csv_path.name,
+        "source_version": list(source_version),
+        "rows": int(len(df)),
+        "columns": columns,
+    }
+    with open(tmp_dir / MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    old_dir = out_dir.with_name(out_dir.name + ".old")
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if out_dir.exists():
+        os.replace(out_dir, old_dir)
+    os.replace(tmp_dir, out_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    return manifest
+
+
+def read_manifest_at(table_dir: Path, csv_path: Path):
+    """
+    Manifest stored in table_dir, or None if it is missing or older than
+    csv_path.
+    """
+    try:
+        with open(table_dir / MANIFEST_FILE) as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    if manifest.get("format_version") != FORMAT_VERSION:
+        return None
+
+    # A CSV rewritten after conversion wins over the converted copy
+    if csv_path.exists() and list(file_version(csv_path)) != manifest["source_version"]:
+        return None
+
+    return manifest
+
+
+def read_manifest(brand: str, table: str, data_dir: Path = None):
+    """
+    Manifest of a converted table, or None if it is missing or stale.
+    """
+    data_dir = data_dir or BASE_DATA_DIR
+    return read_manifest_at(
+        columnar_dir(brand, table, data_dir),
+        data_dir / brand.lower() / f"{table}.csv",
+    )
+
+
+def open_columns(table_dir: Path, manifest: dict, columns=None) -> dict:
+    """
+    Memory-map converted columns read-only as {name: ndarray}.
+    """
+    by_name = {col["name"]: col for col in manifest["columns"]}
+    names = columns if columns is not None else list(by_name)
+
+    missing = [name for name in names if name not in by_name]
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown columns: {', '.join(missing)}"
+        )
+
+    result = {}
+    for name in names:
+        col = by_name[name]
+        is_object = np.dtype(col["dtype"]) == object
+        result[name] = np.load(
+            table_dir / col["file"],
+            mmap_mode=None if is_object else "r",
+            allow_pickle=is_object,
+        )
+    return result
+
+
+def table_version(brand: str, table: str, data_dir: Path = None):
+    """
+    Version stamp of a table's source data.
+    Raises FileNotFoundError when neither CSV nor converted copy exists.
+    """
+    data_dir = data_dir or BASE_DATA_DIR
+    csv_path = data_dir / brand.lower() / f"{table}.csv"
+
+    if csv_path.exists():
+        return file_version(csv_path)
+
+    manifest = read_manifest(brand, table, data_dir)
+    if manifest is None:
+        raise FileNotFoundError(csv_path)
+    return tuple(manifest["source_version"])
+
+
+def load_columns(brand: str, table: str, columns=None, data_dir: Path = None) -> dict:
+    """
+    Columns of a table as {name: ndarray}.
+
+    Converted tables are memory mapped read-only and only the requested
+    columns are touched; otherwise the CSV is parsed with usecols.
+    """
+    data_dir = data_dir or BASE_DATA_DIR
+    manifest = read_manifest(brand, table, data_dir)
+
+    if manifest is None:
+        csv_path = data_dir / brand.lower() / f"{table}.csv"
+        if not csv_path.exists():
+            raise HTTPException(
+                status_code=404,
+                detail=f"Data file not found for brand '{brand}': {table}.csv"
+            )
+        df = pd.read_csv(csv_path, usecols=columns)
+        names = columns if columns is not None else list(df.columns)
+        return {name: df[name].to_numpy() for name in names}
+
+    return open_columns(columnar_dir(brand, table, data_dir), manifest, columns)
+
+
+def load_table(brand: str, table: str, columns=None, data_dir: Path = None) -> "pd.DataFrame":
+    """
+    Table as a DataFrame, with the same column projection as load_columns.
+    """
+    arrays = load_columns(brand, table, columns, data_dir)
+    return pd.DataFrame(arrays, copy=False)
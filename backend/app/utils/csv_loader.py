@@ -1,7 +1,13 @@
 from pathlib import Path
-import pandas as pd
+from collections import OrderedDict
 from fastapi import HTTPException
+import threading
 import os
+import sys
+from app.utils.lazy import lazy_import
+from app.utils.metrics import dataset_load_duration
+
+pd = lazy_import("pandas")
 
 # Use os.getcwd() to get the actual working directory
 # When Procfile does "cd backend && uvicorn", cwd is the backend folder
@@ -14,12 +20,131 @@ else:
     # We're running from project root (local development)
     BASE_DATA_DIR = cwd / "data" / "processed"
 
-print(f"📊 Current working directory: {cwd}")
-print(f"📊 Data directory path: {BASE_DATA_DIR}")
-print(f"📊 Data directory exists: {BASE_DATA_DIR.exists()}")
+# Cache limits (entries and approximate bytes of parsed data)
+CSV_CACHE_MAX_ENTRIES = int(os.getenv("CSV_CACHE_MAX_ENTRIES", "256"))
+CSV_CACHE_MAX_BYTES = int(os.getenv("CSV_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Records measured when estimating the size of a parsed records list
+RECORDS_SIZE_SAMPLE = 100
 
 
-def load_csv(brand: str, filename: str):
+def records_nbytes(records: list) -> int:
+    """
+    Approximate memory held by a list of row dicts: the list plus each dict
+    and its values, extrapolated from the first rows (keys are shared).
+    """
+    nbytes = sys.getsizeof(records)
+    sample = records[:RECORDS_SIZE_SAMPLE]
+    if not sample:
+        return nbytes
+    sampled = sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+        for row in sample
+    )
+    return nbytes + sampled * len(records) // len(sample)
+
+
+def describe_data_dir():
+    """
+    Log where data is read from (called at startup, not import).
+    """
+    print(f"📊 Current working directory: {cwd}")
+    print(f"📊 Data directory path: {BASE_DATA_DIR}")
+    print(f"📊 Data directory exists: {BASE_DATA_DIR.exists()}")
+
+
+def file_version(path: Path):
+    """
+    Version stamp of a data file: (mtime_ns, size).
+    Changes whenever the file is rewritten.
+    """
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class DatasetCache:
+    """
+    Bounded LRU cache of parsed data files.
+
+    Entries are keyed by (brand, filename) and remember the file version they
+    were built from, so a rewritten file is re-parsed on the next access.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["version"] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, version, frame: "pd.DataFrame", records: list):
+        # Both representations stay in memory, so both count against the budget
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum()) + records_nbytes(records)
+        entry = {
+            "version": version,
+            "frame": frame,
+            "records": records,
+            "nbytes": nbytes,
+        }
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old["nbytes"]
+
+            # An entry larger than the whole budget is served but not kept
+            if nbytes > self.max_bytes:
+                return entry
+
+            self._entries[key] = entry
+            self.total_bytes += nbytes
+
+            while (
+                len(self._entries) > self.max_entries
+                or self.total_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= evicted["nbytes"]
+                self.evictions += 1
+
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+dataset_cache = DatasetCache(CSV_CACHE_MAX_ENTRIES, CSV_CACHE_MAX_BYTES)
+
+
+def data_file(brand: str, filename: str) -> Path:
     file_path = BASE_DATA_DIR / brand.lower() / filename
 
     if not file_path.exists():
@@ -34,12 +159,44 @@ def load_csv(brand: str, filename: str):
             detail=f"Data file not found for brand '{brand}': {filename}"
         )
 
+    return file_path
+
+
+def _load_entry(brand: str, filename: str) -> dict:
+    file_path = data_file(brand, filename)
+    key = (brand.lower(), filename)
+    version = file_version(file_path)
+
+    entry = dataset_cache.get(key, version)
+    if entry is not None:
+        return entry
+
     try:
-        df = pd.read_csv(file_path)
+        with dataset_load_duration.time(source="csv"):
+            df = pd.read_csv(file_path)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error reading CSV file '{filename}': {str(e)}"
         )
 
-    return df.to_dict(orient="records")
+    return dataset_cache.put(key, version, df, df.to_dict(orient="records"))
+
+
+def load_csv(brand: str, filename: str):
+    """
+    Rows of a brand data file as a list of dicts.
+    The list is shared between requests and must not be mutated.
+    """
+    return _load_entry(brand, filename)["records"]
+
+
+def load_frame(brand: str, filename: str) -> "pd.DataFrame":
+    """
+    Parsed DataFrame of a brand data file (shared, treat as read-only).
+    """
+    return _load_entry(brand, filename)["frame"]
+
+
+def cache_stats() -> dict:
+    return dataset_cache.stats()
@@ -0,0 +1,88 @@
+import hashlib
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from fastapi import HTTPException, Request, Response
+
+# Cache-Control sent with analytics responses (they are per-user, so private)
+ANALYTICS_CACHE_CONTROL = os.getenv("ANALYTICS_CACHE_CONTROL", "private, max-age=60")
+
+
+def _versions(paths):
+    versions = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        versions.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return versions
+
+
+def data_validators(resource: str, paths):
+    """
+    Strong ETag and Last-Modified for a resource built from the given files.
+    """
+    versions = _versions(paths)
+    digest = hashlib.sha1(resource.encode("utf-8"))
+    for name, mtime_ns, size in sorted(versions):
+        digest.update(f"|{name}:{mtime_ns}:{size}".encode("utf-8"))
+
+    etag = f'"{digest.hexdigest()[:32]}"'
+    newest = max((mtime_ns for _, mtime_ns, _ in versions), default=0)
+    return etag, newest // 1_000_000_000
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison function
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _not_modified_since(header: str, last_modified: int) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return since is not None and last_modified <= since.timestamp()
+
+
+def conditional_get(request: Request, response: Response, paths):
+    """
+    Attach ETag/Last-Modified/Cache-Control to the response, or raise a
+    304 when the client's cached copy is still current. Returns the ETag.
+
+    Handlers called directly (request is None) skip validation.
+    """
+    if request is None:
+        return None
+
+    resource = request.url.path + ("?" + request.url.query if request.url.query else "")
+    etag, last_modified = data_validators(resource, paths)
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": ANALYTICS_CACHE_CONTROL,
+        "Vary": "Authorization",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        not_modified = if_modified_since is not None and _not_modified_since(if_modified_since, last_modified)
+
+    if not_modified:
+        raise HTTPException(status_code=304, headers=headers)
+
+    if response is not None:
+        response.headers.update(headers)
+    return etag
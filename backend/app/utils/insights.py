@@ -0,0 +1,146 @@
+from app.utils.aggregates import MASTER_TABLE, aggregate_store
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.versioned_cache import VersionedCache
+from app.utils.view_registry import load_view
+
+# Per-brand bundle of computed metrics behind MCP answers. It is built once
+# per data version (the brand's derived files plus every master file, since
+# the ranking spans brands), so answering a question is a lookup + template.
+
+# system -> (temperature view, distribution view, aggregate risk key)
+SYSTEMS = {
+    "engine": ("engine_temp_perf.csv", "engine_perf_distribution.csv", "engine_risk"),
+    "battery": ("battery_temp_perf.csv", "battery_health_distribution.csv", "battery_risk"),
+    "brakes": ("brake_temp_perf.csv", "brake_wear_distribution.csv", "brake_risk"),
+}
+
+# Share of readings flagged as imminent failure -> risk level
+RISK_LEVELS = [(0.01, "LOW"), (0.05, "MODERATE"), (float("inf"), "HIGH")]
+# Fleet health score -> status
+FLEET_STATUS = [(90, "GOOD"), (75, "FAIR"), (float("-inf"), "POOR")]
+
+
+def _risk_level(fraction: float) -> str:
+    for limit, level in RISK_LEVELS:
+        if fraction < limit:
+            return level
+    return RISK_LEVELS[-1][1]
+
+
+def _fleet_status(score: float) -> str:
+    for floor, status in FLEET_STATUS:
+        if score >= floor:
+            return status
+    return FLEET_STATUS[-1][1]
+
+
+def _band_extremes(rows: list) -> dict:
+    if not rows:
+        return {}
+    value_key = [key for key in rows[0] if key not in ("temp_band", "temperature")][0]
+    band_key = "temp_band" if "temp_band" in rows[0] else "temperature"
+    ordered = sorted(rows, key=lambda row: row[value_key])
+    return {
+        "low": {"band": ordered[0][band_key], "value": float(ordered[0][value_key])},
+        "high": {"band": ordered[-1][band_key], "value": float(ordered[-1][value_key])},
+    }
+
+
+def _distribution(rows: list) -> list:
+    # Engine/battery views keep the raw "count,count" columns, brakes label/value
+    pairs = [
+        (row["label"], row["value"]) if "label" in row else (row["count"], row["count.1"])
+        for row in rows
+    ]
+    total = sum(count for _, count in pairs)
+    return [
+        {"label": label, "count": int(count), "share": count / total if total else 0.0}
+        for label, count in pairs
+    ]
+
+
+def _system_insights(brand: str, system: str, agg: dict) -> dict:
+    temp_file, distribution_file, risk_key = SYSTEMS[system]
+
+    # Share of readings flagged imminent, the same figure as the risk views
+    flagged = agg[risk_key]
+    distribution = _distribution(load_view(brand, distribution_file))
+    return {
+        "flagged_fraction": flagged,
+        "risk_level": _risk_level(flagged),
+        "temperature_bands": _band_extremes(load_view(brand, temp_file)),
+        "distribution": distribution,
+        "dominant_bucket": max(distribution, key=lambda b: b["count"]) if distribution else None,
+    }
+
+
+def _ranking(brand: str) -> dict:
+    scores = sorted(
+        ((b, agg["fleet_health"]) for b, agg in aggregate_store.all_brands().items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    position = next((i for i, (b, _) in enumerate(scores, start=1) if b == brand), None)
+    return {
+        "rank": position,
+        "total_brands": len(scores),
+        "leader": {"brand": scores[0][0], "score": scores[0][1]} if scores else None,
+    }
+
+
+def build_insights(brand: str) -> dict:
+    """
+    Computed metrics for one brand: fleet summary, per-system risk, and
+    the brand's place in the global ranking.
+    """
+    brand = brand.lower()
+    agg = aggregate_store.get(brand)
+    if agg is None:
+        return None
+
+    return {
+        "brand": brand,
+        "summary": {
+            "fleet_health_score": agg["fleet_health"],
+            "status": _fleet_status(agg["fleet_health"]),
+            "engine_health": 100 * (1 - agg["engine_risk"]),
+            "battery_health": 100 * (1 - agg["battery_risk"]),
+            "brake_health": 100 * (1 - agg["brake_risk"]),
+            "records": agg["total_vehicles"],
+        },
+        "engine": _system_insights(brand, "engine", agg),
+        "battery": _system_insights(brand, "battery", agg),
+        "brakes": _system_insights(brand, "brakes", agg),
+        "ranking": _ranking(brand),
+    }
+
+
+def _data_version(brand: str):
+    brand_dir = BASE_DATA_DIR / brand
+    paths = [brand_dir / f for temp_file, dist_file, _ in SYSTEMS.values() for f in (temp_file, dist_file)]
+    paths += sorted(BASE_DATA_DIR.glob(f"*/{MASTER_TABLE}.csv"))
+
+    version = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        version.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+_bundles = VersionedCache(max_entries=64)
+
+
+def get_insights(brand: str):
+    """
+    Insight bundle for a brand, rebuilt only when its data changes.
+    None when the brand has no data.
+    """
+    brand = brand.lower()
+    return _bundles.get_or_build(brand, _data_version(brand), lambda: build_insights(brand))
+
+
+def insights_cache_stats() -> dict:
+    return _bundles.stats()
@@ -0,0 +1,87 @@
+import re
+
+# Question -> MCP sections. Keywords are compiled once into a token index, so
+# classifying a question is one tokenization plus dictionary lookups, and a
+# question naming several systems is routed to all of them.
+
+# intent -> {keyword: weight}. Weights below MIN_SCORE only count together
+# with other evidence ("health" alone is not a fleet question).
+INTENTS = {
+    "engine": {
+        "engine": 1.0, "motor": 1.0, "rpm": 1.0, "oil": 1.0, "coolant": 1.0,
+        "overheat": 1.0, "temperature": 0.5, "vibration": 1.0, "exhaust": 1.0,
+    },
+    "battery": {
+        "battery": 1.0, "batteries": 1.0, "voltage": 1.0, "charge": 1.0,
+        "alternator": 1.0, "ev": 0.5,
+    },
+    "brakes": {
+        "brake": 1.0, "brakes": 1.0, "braking": 1.0, "pad": 1.0, "pads": 1.0,
+        "abs": 1.0, "wear": 0.5,
+    },
+    "ranking": {
+        "rank": 1.0, "ranking": 1.0, "ranked": 1.0, "leaderboard": 1.0,
+        "compare": 0.5, "competitors": 1.0, "peers": 1.0, "best": 0.5,
+    },
+    "summary": {
+        "fleet": 1.0, "summary": 1.0, "overall": 1.0, "overview": 1.0,
+        "health": 0.5, "status": 0.5,
+    },
+}
+
+MIN_SCORE = 1.0
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list:
+    return _TOKEN.findall(text.lower())
+
+
+class IntentRouter:
+    """
+    Keyword-scored intent classifier.
+
+    `route(question)` returns every intent scoring at least MIN_SCORE, best
+    first (ties keep the declaration order of INTENTS). Tokens also match
+    keywords of 4+ letters they start with, so most plurals and suffixes
+    ("engines", "overheating") need no extra entries.
+    """
+
+    def __init__(self, intents: dict, min_score: float = MIN_SCORE):
+        self.intents = list(intents)
+        self.min_score = min_score
+        self._order = {intent: i for i, intent in enumerate(self.intents)}
+
+        # keyword -> [(intent, weight)]
+        self._index = {}
+        for intent, keywords in intents.items():
+            for keyword, weight in keywords.items():
+                self._index.setdefault(keyword, []).append((intent, weight))
+        self._keywords = sorted(self._index, key=len, reverse=True)
+
+    def _lookup(self, token: str) -> list:
+        hits = self._index.get(token)
+        if hits is not None:
+            return hits
+        # Longest keyword the token extends ("overheating" -> "overheat")
+        return next(
+            (self._index[k] for k in self._keywords if len(k) >= 4 and token.startswith(k)),
+            [],
+        )
+
+    def scores(self, question: str) -> dict:
+        scores = {}
+        for token in set(tokenize(question)):
+            for intent, weight in self._lookup(token):
+                scores[intent] = scores.get(intent, 0.0) + weight
+        return scores
+
+    def route(self, question: str) -> list:
+        scores = self.scores(question)
+        matched = [intent for intent, score in scores.items() if score >= self.min_score]
+        return sorted(matched, key=lambda intent: (-scores[intent], self._order[intent]))
+
+
+# Compiled once, when the MCP routes are imported at startup
+intent_router = IntentRouter(INTENTS)
@@ -0,0 +1,25 @@
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, callers re-check state
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: Path):
+    """
+    Exclusive lock shared by every process on the host (uvicorn workers).
+    """
+    if fcntl is None:
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,87 @@
+from collections import defaultdict
+from pathlib import Path
+from app.utils.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+# Compact in-memory schema for master_vehicle_data.csv.
+# Default parsing gives float64/int64 numbers and Python strings; here labels
+# become categoricals, 0/1 flags uint8, sensor readings float32 and dates
+# datetime64. Columns not listed are sensor readings.
+CATEGORY_COLUMNS = ["vehicle_id", "brand", "failure_type"]
+
+FLAG_COLUMNS = [
+    "abs_fault_indicator",
+    "engine_failure_imminent",
+    "brake_issue_imminent",
+    "battery_issue_imminent",
+]
+
+# Column -> strptime format
+TIMESTAMP_COLUMNS = {
+    "timestamp": "%Y-%m-%d %H:%M:%S",
+    "failure_date": "%d-%m-%Y %H:%M",
+}
+
+FLAG_DTYPE = "uint8"
+SENSOR_DTYPE = "float32"
+
+
+def column_dtype(name: str) -> str:
+    """
+    Target dtype of a master column.
+    """
+    if name in CATEGORY_COLUMNS:
+        return "category"
+    if name in FLAG_COLUMNS:
+        return FLAG_DTYPE
+    if name in TIMESTAMP_COLUMNS:
+        return "datetime64"
+    return SENSOR_DTYPE
+
+
+def read_master_csv(path: Path, usecols=None) -> "pd.DataFrame":
+    """
+    Parse a master CSV straight into the compact schema.
+    """
+    # Dates are read as text and parsed with their explicit format below
+    dtype = defaultdict(lambda: SENSOR_DTYPE)
+    dtype.update({name: "category" for name in CATEGORY_COLUMNS})
+    dtype.update({name: FLAG_DTYPE for name in FLAG_COLUMNS})
+    dtype.update({name: str for name in TIMESTAMP_COLUMNS})
+
+    df = pd.read_csv(path, usecols=usecols, dtype=dtype)
+    return compact_frame(df)
+
+
+def compact_frame(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Master frame with every column converted to its compact dtype.
+    """
+    columns = {}
+    for name in df.columns:
+        series = df[name]
+        target = column_dtype(name)
+
+        if name in TIMESTAMP_COLUMNS:
+            if not pd.api.types.is_datetime64_dtype(series.dtype):
+                series = pd.to_datetime(series, format=TIMESTAMP_COLUMNS[name])
+        elif target == "category":
+            series = series.astype("category")
+        elif target == FLAG_DTYPE:
+            # Missing flags count as "not raised"
+            series = series.fillna(0).astype(FLAG_DTYPE)
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            series = series.astype(SENSOR_DTYPE)
+
+        columns[name] = series
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def frame_footprint(df: "pd.DataFrame") -> dict:
+    """
+    Deep memory usage in bytes per column.
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    return {name: int(nbytes) for name, nbytes in usage.items()}
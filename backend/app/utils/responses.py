@@ -0,0 +1,109 @@
+import json
+import math
+import os
+from datetime import date, datetime
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from app.utils.versioned_cache import VersionedCache
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback below
+    orjson = None
+
+# Pre-serialized bodies of cacheable responses, keyed by their ETag
+SERIALIZED_CACHE_MAX_ENTRIES = int(os.getenv("SERIALIZED_CACHE_MAX_ENTRIES", "1024"))
+
+
+def _default(obj):
+    """
+    Encode the NumPy/pandas values that show up in DataFrame output.
+    """
+    if getattr(obj, "ndim", None) == 0 and hasattr(obj, "item"):
+        # NumPy scalar (np.int64, np.float32, np.bool_, ...)
+        return _finite(obj.item())
+    if hasattr(obj, "tolist"):
+        return _without_nan(obj.tolist())
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _finite(value):
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _without_nan(obj):
+    if isinstance(obj, float):
+        return _finite(obj)
+    if isinstance(obj, dict):
+        return {key: _without_nan(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_without_nan(value) for value in obj]
+    return obj
+
+
+def dumps(content) -> bytes:
+    """
+    Serialize to JSON bytes. NaN/Infinity become null, NumPy values plain JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+    def encode(obj):
+        return json.dumps(
+            obj,
+            default=_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    try:
+        return encode(content)
+    except ValueError:
+        return encode(_without_nan(content))
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Default response class: orjson when installed, with NumPy/NaN handling.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+_serialized = VersionedCache(max_entries=SERIALIZED_CACHE_MAX_ENTRIES)
+
+
+def cached_json(response: Response, etag, build):
+    """
+    JSON response for a payload identified by its ETag, serialized once and
+    reused until the underlying data changes.
+
+    Handlers called directly (no ETag) get the payload object from build().
+    """
+    if etag is None:
+        return build()
+
+    body = _serialized.get_or_build(etag, etag, lambda: dumps(build()))
+
+    headers = None
+    if response is not None:
+        # Keep ETag/Cache-Control set by conditional_get on the injected response
+        headers = {
+            key: value for key, value in response.headers.items()
+            if key not in ("content-length", "content-type")
+        }
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def serialized_cache_stats() -> dict:
+    return _serialized.stats()
@@ -0,0 +1,213 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+from app.utils.columnar import table_version
+from app.utils.lazy import lazy_import
+from app.utils.metrics import risk_scoring_duration
+from app.utils.vehicle_index import MASTER_TABLE, get_vehicle_index
+from app.utils.versioned_cache import VersionedCache
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# Per-vehicle risk over each vehicle's most recent readings. Every feature is
+# computed for all vehicles at once from cumulative sums over the index's
+# (vehicle_id, timestamp)-sorted columns, so cost is a few passes over each
+# column whatever the number of vehicles.
+
+# Sensor -> (direction in which it is bad, weight). A vehicle's window mean
+# is compared with the whole brand fleet in standard deviations.
+RISK_FEATURES = {
+    "engine_temp_c": (1, 1.0),
+    "coolant_temp_c": (1, 0.5),
+    "oil_pressure_psi": (-1, 1.0),
+    "vibration_level": (1, 1.0),
+    "brake_pad_wear_mm": (1, 1.0),
+    "brake_fluid_level_psi": (-1, 0.5),
+    "battery_health_percent": (-1, 1.0),
+    "battery_voltage_v": (-1, 0.5),
+}
+
+# Imminent-failure flags -> system; their rate in the window adds to the score
+RISK_FLAGS = {
+    "engine_failure_imminent": "engine",
+    "brake_issue_imminent": "brakes",
+    "battery_issue_imminent": "battery",
+}
+FLAG_WEIGHT = 3.0
+
+# Readings per vehicle in the scoring window (48 = one day at 30 minutes)
+RISK_WINDOW_READINGS = int(os.getenv("RISK_WINDOW_READINGS", "48"))
+# Rows per scoring task; larger brands are split across the worker threads
+RISK_CHUNK_ROWS = int(os.getenv("RISK_CHUNK_ROWS", "250000"))
+# Drivers reported per vehicle
+TOP_DRIVERS = 3
+
+# NumPy releases the GIL for the array passes, so chunks run in parallel
+_pool = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RISK_SCORING_WORKERS", str(os.cpu_count() or 1))),
+    thread_name_prefix="risk"
+)
+
+
+def _window_means(values: "np.ndarray", starts: "np.ndarray", ends: "np.ndarray", window: int) -> "np.ndarray":
+    """
+    Mean of the last `window` values of every [start, end) group.
+    """
+    offset = starts[0]
+    sums = np.concatenate(([0.0], np.cumsum(values[offset:ends[-1]], dtype="float64")))
+    lo = np.maximum(ends - window, starts) - offset
+    hi = ends - offset
+    return (sums[hi] - sums[lo]) / (hi - lo)
+
+
+def _score_chunk(columns: dict, fleet: dict, starts, ends, window: int) -> dict:
+    z = {}
+    for name, (direction, _) in RISK_FEATURES.items():
+        mean, std = fleet[name]
+        z[name] = direction * (_window_means(columns[name], starts, ends, window) - mean) / std
+
+    rates = {
+        system: _window_means(columns[flag], starts, ends, window)
+        for flag, system in RISK_FLAGS.items()
+    }
+
+    score = np.zeros(len(starts))
+    for name, (_, weight) in RISK_FEATURES.items():
+        score += weight * np.clip(z[name], 0, None)
+    for rate in rates.values():
+        score += FLAG_WEIGHT * rate
+
+    return {"score": score, "z": z, "rates": rates}
+
+
+def _chunks(starts: "np.ndarray", ends: "np.ndarray", chunk_rows: int) -> list:
+    # Vehicle ranges [a, b) of roughly chunk_rows rows, split between vehicles
+    if len(ends) == 0:
+        return []
+    marks = np.arange(chunk_rows, int(ends[-1]), chunk_rows)
+    cuts = np.unique(np.searchsorted(ends, marks, side="left") + 1)
+    bounds = [0] + [int(c) for c in cuts if 0 < c < len(ends)] + [len(ends)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class FleetRisk:
+    """
+    Risk scores of every vehicle in a brand, ranked highest first.
+    """
+
+    def __init__(self, vehicle_ids, last_timestamps, readings, fleet: dict, scored: dict, window: int):
+        self.window = window
+        self.fleet = fleet
+        self.order = np.argsort(-scored["score"], kind="stable")
+        self.vehicle_ids = vehicle_ids
+        self.last_timestamps = last_timestamps
+        self.readings = readings
+        self.scored = scored
+
+    def __len__(self):
+        return len(self.vehicle_ids)
+
+    def _vehicle(self, rank: int, i: int) -> dict:
+        z = {name: float(values[i]) for name, values in self.scored["z"].items()}
+        drivers = sorted((name for name in z if z[name] > 0), key=lambda name: z[name], reverse=True)
+        return {
+            "rank": rank,
+            "vehicle_id": str(self.vehicle_ids[i]),
+            "risk_score": round(float(self.scored["score"][i]), 3),
+            "window_readings": int(self.readings[i]),
+            "last_timestamp": str(pd.Timestamp(self.last_timestamps[i])),
+            "drivers": [
+                {
+                    "metric": name,
+                    "deviation": round(z[name], 2),
+                    "fleet_mean": round(self.fleet[name][0], 3),
+                }
+                for name in drivers[:TOP_DRIVERS]
+            ],
+            "imminent_rate": {
+                system: round(float(rate[i]), 4)
+                for system, rate in self.scored["rates"].items()
+            },
+        }
+
+    def top(self, n: int) -> list:
+        return [
+            self._vehicle(rank, int(i))
+            for rank, i in enumerate(self.order[:n], start=1)
+        ]
+
+
+def score_fleet(index, window: int = RISK_WINDOW_READINGS, chunk_rows: int = RISK_CHUNK_ROWS) -> FleetRisk:
+    """
+    Score every vehicle of a VehicleIndex over its last `window` readings.
+    """
+    frame = index.frame
+    columns = {}
+    fleet = {}
+    for name in RISK_FEATURES:
+        values = frame[name].to_numpy(dtype="float64")
+        mean = float(np.nanmean(values)) if len(values) else 0.0
+        std = float(np.nanstd(values)) if len(values) else 0.0
+        fleet[name] = (mean, std if std > 0 else 1.0)
+        # A missing reading counts as a fleet-average one
+        columns[name] = np.where(np.isnan(values), mean, values)
+    for flag in RISK_FLAGS:
+        columns[flag] = frame[flag].to_numpy(dtype="float64")
+
+    starts = np.asarray(index.starts, dtype="int64")
+    ends = np.asarray(index.ends, dtype="int64")
+
+    parts = [
+        _pool.submit(_score_chunk, columns, fleet, starts[a:b], ends[a:b], window)
+        for a, b in _chunks(starts, ends, chunk_rows)
+    ]
+    parts = [part.result() for part in parts]
+
+    if parts:
+        scored = {
+            "score": np.concatenate([p["score"] for p in parts]),
+            "z": {name: np.concatenate([p["z"][name] for p in parts]) for name in RISK_FEATURES},
+            "rates": {system: np.concatenate([p["rates"][system] for p in parts]) for system in RISK_FLAGS.values()},
+        }
+        last_timestamps = index.timestamps[ends - 1]
+    else:
+        scored = {
+            "score": np.zeros(0),
+            "z": {name: np.zeros(0) for name in RISK_FEATURES},
+            "rates": {system: np.zeros(0) for system in RISK_FLAGS.values()},
+        }
+        last_timestamps = index.timestamps[:0]
+
+    readings = np.minimum(ends - starts, window)
+    return FleetRisk(index.vehicle_ids, last_timestamps, readings, fleet, scored, window)
+
+
+_scores = VersionedCache(max_entries=16)
+
+
+def get_fleet_risk(brand: str) -> FleetRisk:
+    """
+    Ranked vehicle risk for a brand, recomputed only when its master data changes.
+    """
+    brand = brand.lower()
+    index = get_vehicle_index(brand)
+
+    def build():
+        with risk_scoring_duration.time():
+            return score_fleet(index)
+
+    return _scores.get_or_build(brand, table_version(brand, MASTER_TABLE), build)
+
+
+def vehicles_at_risk(brand: str, top: int) -> dict:
+    risk = get_fleet_risk(brand)
+    return {
+        "brand": brand.lower(),
+        "total_vehicles": len(risk),
+        "window_readings": risk.window,
+        "vehicles": risk.top(top),
+    }
+
+
+def risk_cache_stats() -> dict:
+    return _scores.stats()
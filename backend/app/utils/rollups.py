@@ -0,0 +1,214 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.columnar import load_columns, read_manifest
+from app.utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+MASTER_TABLE = "master_vehicle_data"
+
+# Every derived view is a histogram or a per-band mean, so a brand is rolled
+# up with one np.searchsorted per binned column and one np.bincount per
+# output. The intermediate sums/counts ("partials") merge by addition, which
+# lets large CSVs be processed in chunks and brands in separate processes.
+#
+# The engine performance views (engine_temp_perf.csv,
+# engine_perf_distribution.csv) are not rolled up: master telemetry has no
+# engine performance column, so the shipped files cannot be reproduced and
+# are left as they are.
+
+# Bins are right-closed, like pd.cut: (edge[i-1], edge[i]]
+TEMP_BAND_EDGES = [float("-inf"), 0, 10, 20, 30, 50]
+TEMP_BAND_LABELS = [
+    "Very Cold (<0°C)",
+    "Cold (0–10°C)",
+    "Mild (10–20°C)",
+    "Warm (20–30°C)",
+    "Hot (30–50°C)",
+]
+
+BATTERY_HEALTH_EDGES = [0, 40, 60, 80, 100]
+BATTERY_HEALTH_LABELS = ["Critical (0–40)", "Weak (40–60)", "Okay (60–80)", "Healthy (80–100)"]
+
+BRAKE_WEAR_EDGES = [0, 2, 4, 6, float("inf")]
+BRAKE_WEAR_LABELS = ["Low wear (0–2mm)", "Moderate (2–4mm)", "High (4–6mm)", "Critical (6mm+)"]
+
+RISK_FLAGS = {
+    "engine_risk_summary.csv": "engine_failure_imminent",
+    "battery_risk_summary.csv": "battery_issue_imminent",
+    "brake_risk_summary.csv": "brake_issue_imminent",
+}
+
+ROLLUP_COLUMNS = [
+    "ambient_temp_c",
+    "battery_health_percent",
+    "brake_temp_c",
+    "brake_pad_wear_mm",
+    *RISK_FLAGS.values(),
+]
+
+ROLLUP_VIEWS = [
+    "engine_risk_summary.csv",
+    "battery_temp_perf.csv",
+    "battery_health_distribution.csv",
+    "battery_risk_summary.csv",
+    "brake_temp_perf.csv",
+    "brake_wear_distribution.csv",
+    "brake_risk_summary.csv",
+]
+
+# Rows parsed per chunk when rolling up straight from CSV
+ROLLUP_CHUNK_ROWS = 500_000
+
+
+def bin_index(values, edges):
+    """
+    Right-closed bin index per value (lowest edge included), -1 if outside.
+    """
+    values = np.asarray(values, dtype=float)
+    edges = np.asarray(edges, dtype=float)
+    idx = np.searchsorted(edges, values, side="left") - 1
+    idx[values == edges[0]] = 0
+    idx[(idx < 0) | (idx >= len(edges) - 1) | np.isnan(values)] = -1
+    return idx
+
+
+def binned_counts(idx, nbins):
+    return np.bincount(idx[idx >= 0], minlength=nbins)
+
+
+def binned_sums(idx, weights, nbins):
+    keep = idx >= 0
+    return np.bincount(idx[keep], weights=np.asarray(weights, dtype=float)[keep], minlength=nbins)
+
+
+def partial_rollup(cols: dict) -> dict:
+    """
+    Mergeable sums and counts for one block of master rows.
+    """
+    nbands = len(TEMP_BAND_LABELS)
+    band = bin_index(cols["ambient_temp_c"], TEMP_BAND_EDGES)
+
+    partial = {
+        "band_rows": binned_counts(band, nbands),
+        "band_battery_health": binned_sums(band, cols["battery_health_percent"], nbands),
+        "band_brake_temp": binned_sums(band, cols["brake_temp_c"], nbands),
+        "battery_health_dist": binned_counts(
+            bin_index(cols["battery_health_percent"], BATTERY_HEALTH_EDGES), len(BATTERY_HEALTH_LABELS)
+        ),
+        "brake_wear_dist": binned_counts(
+            bin_index(cols["brake_pad_wear_mm"], BRAKE_WEAR_EDGES), len(BRAKE_WEAR_LABELS)
+        ),
+    }
+
+    for filename, flag in RISK_FLAGS.items():
+        partial[flag] = np.bincount(np.asarray(cols[flag], dtype=np.int64), minlength=2)
+
+    return partial
+
+
+def merge_partials(a: dict, b: dict) -> dict:
+    merged = {}
+    for key in a:
+        x, y = a[key], b[key]
+        if len(x) < len(y):
+            x, y = y, x
+        out = x.copy()
+        out[:len(y)] += y
+        merged[key] = out
+    return merged
+
+
+def band_means(partial, sum_key, value_column):
+    rows = partial["band_rows"]
+    labels = [label for label, n in zip(TEMP_BAND_LABELS, rows) if n > 0]
+    means = partial[sum_key][rows > 0] / rows[rows > 0]
+    return pd.DataFrame({"temp_band": labels, value_column: means})
+
+
+def distribution(counts, labels):
+    # The historical files carry a duplicated "count,count" header
+    return pd.DataFrame(
+        [[label, int(n)] for label, n in zip(labels, counts)],
+        columns=["count", "count"],
+    )
+
+
+def _risk_summary(counts, flag):
+    total = counts.sum()
+    observed = np.flatnonzero(counts)
+    return pd.DataFrame({flag: observed, "fraction": counts[observed] / total})
+
+
+def finalize_views(partial: dict) -> dict:
+    """
+    The derived views reproducible from master data (ROLLUP_VIEWS) as
+    DataFrames, keyed by file name.
+    """
+    views = {
+        "battery_temp_perf.csv": band_means(partial, "band_battery_health", "avg_battery_health_percent"),
+        "battery_health_distribution.csv": distribution(partial["battery_health_dist"], BATTERY_HEALTH_LABELS),
+        "brake_temp_perf.csv": band_means(partial, "band_brake_temp", "avg_brake_temp_c"),
+        "brake_wear_distribution.csv": distribution(partial["brake_wear_dist"], BRAKE_WEAR_LABELS),
+    }
+    for filename, flag in RISK_FLAGS.items():
+        views[filename] = _risk_summary(partial[flag], flag)
+    return views
+
+
+def compute_brand_views(brand: str, data_dir: Path = None) -> dict:
+    """
+    Roll up one brand. Converted (columnar) data is read column-wise;
+    plain CSVs are streamed in chunks so memory stays bounded.
+    """
+    data_dir = data_dir or BASE_DATA_DIR
+
+    if read_manifest(brand, MASTER_TABLE, data_dir) is not None:
+        return finalize_views(partial_rollup(load_columns(brand, MASTER_TABLE, ROLLUP_COLUMNS, data_dir)))
+
+    csv_path = data_dir / brand.lower() / f"{MASTER_TABLE}.csv"
+    partial = None
+    for chunk in pd.read_csv(csv_path, usecols=ROLLUP_COLUMNS, chunksize=ROLLUP_CHUNK_ROWS):
+        block = partial_rollup({name: chunk[name].to_numpy() for name in ROLLUP_COLUMNS})
+        partial = block if partial is None else merge_partials(partial, block)
+
+    if partial is None:
+        partial = partial_rollup({name: np.array([]) for name in ROLLUP_COLUMNS})
+    return finalize_views(partial)
+
+
+def write_views(brand_dir: Path, views: dict):
+    for filename, frame in views.items():
+        tmp_path = brand_dir / f".{filename}.tmp"
+        frame.to_csv(tmp_path, index=False)
+        tmp_path.replace(brand_dir / filename)
+
+
+def rollup_brand(brand: str, data_dir: Path = None, write: bool = True) -> dict:
+    """
+    Compute a brand's views and optionally write them next to its master file.
+    Returns {file name: row count}.
+    """
+    data_dir = data_dir or BASE_DATA_DIR
+    views = compute_brand_views(brand, data_dir)
+    if write:
+        write_views(data_dir / brand.lower(), views)
+    return {filename: len(frame) for filename, frame in views.items()}
+
+
+def rollup_brands(brands, data_dir: Path = None, write: bool = True, max_workers: int = None) -> dict:
+    """
+    Roll up several brands in parallel, one brand per worker process.
+    """
+    data_dir = data_dir or BASE_DATA_DIR
+    brands = list(brands)
+
+    if max_workers == 1 or len(brands) <= 1:
+        return {brand: rollup_brand(brand, data_dir, write) for brand in brands}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(rollup_brand, brands, [data_dir] * len(brands), [write] * len(brands))
+        return dict(zip(brands, results))
+
@@ -1,19 +1,41 @@
-from passlib.context import CryptContext
-from jose import jwt
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import os
+import secrets
+import threading
 import bcrypt
+from app.utils.lazy import lazy_import
+
+jwt = lazy_import("jose.jwt")
 
 # 🔐 JWT settings
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-this")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12
-)
+# 🔐 bcrypt settings
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Worker processes reserved for password hashing/verification
+BCRYPT_POOL_SIZE = int(os.getenv("BCRYPT_POOL_SIZE", str(os.cpu_count() or 1)))
+
+_pwd_context = None
+
+
+def get_pwd_context():
+    """
+    passlib context, only built when the bcrypt fallback is needed.
+    """
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+
+        _pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__rounds=BCRYPT_ROUNDS
+        )
+    return _pwd_context
 
 
 # ✅ Password hashing
@@ -21,13 +43,13 @@ def hash_password(password: str) -> str:
     try:
         # Use bcrypt directly to avoid passlib's version checking issues
         password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt(rounds=12)
+        salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode('utf-8')
     except Exception as e:
         print(f"Error hashing password: {e}")
         # Fallback to passlib
-        return pwd_context.hash(password)
+        return get_pwd_context().hash(password)
 
 
 def verify_password(password: str, hashed: str) -> bool:
@@ -38,7 +60,90 @@ def verify_password(password: str, hashed: str) -> bool:
     except Exception as e:
         print(f"Error verifying password: {e}")
         # Fallback to passlib
-        return pwd_context.verify(password, hashed)
+        return get_pwd_context().verify(password, hashed)
+
+
+def hash_rounds(hashed: str):
+    """
+    Cost factor stored in a bcrypt hash ("$2b$12$..." -> 12), None if unknown.
+    """
+    try:
+        return int(hashed.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def needs_rehash(hashed: str) -> bool:
+    return hash_rounds(hashed) != BCRYPT_ROUNDS
+
+
+# ✅ Password work off the event loop
+# bcrypt holds the CPU for the whole hash, so it runs in a small dedicated
+# process pool instead of the request threadpool.
+_password_pool = None
+_password_pool_lock = threading.Lock()
+_dummy_hash = None
+_dummy_hash_lock = threading.Lock()
+
+
+def configure_password_pool(size: int = None):
+    """
+    (Re)create the password worker pool; used at startup and by benchmarks.
+    """
+    global _password_pool, BCRYPT_POOL_SIZE
+    with _password_pool_lock:
+        if _password_pool is not None:
+            _password_pool.shutdown(wait=True)
+        if size is not None:
+            BCRYPT_POOL_SIZE = size
+        _password_pool = ProcessPoolExecutor(max_workers=BCRYPT_POOL_SIZE)
+    return _password_pool
+
+
+def _get_password_pool():
+    if _password_pool is None:
+        configure_password_pool()
+    return _password_pool
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_password_pool(), verify_password, password, hashed)
+
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_password_pool(), hash_password, password)
+
+
+def hash_passwords(passwords) -> list:
+    """
+    Hash several passwords in parallel on the password pool.
+    """
+    return list(_get_password_pool().map(hash_password, passwords))
+
+
+def prepare_dummy_hash() -> str:
+    """
+    Compute the dummy hash up front (called at startup), so the first login
+    with an unknown email does not pay for an extra hash.
+    """
+    global _dummy_hash
+    with _dummy_hash_lock:
+        if _dummy_hash is None or needs_rehash(_dummy_hash):
+            _dummy_hash = _get_password_pool().submit(hash_password, secrets.token_urlsafe(16)).result()
+    return _dummy_hash
+
+
+async def dummy_hash() -> str:
+    """
+    Hash of a random password at the current cost, verified against when the
+    account does not exist so unknown emails take as long as wrong passwords.
+    """
+    if _dummy_hash is not None and not needs_rehash(_dummy_hash):
+        return _dummy_hash
+    # Fallback when startup did not prepare it; the lock lets one caller hash
+    return await asyncio.to_thread(prepare_dummy_hash)
 
 
 # ✅ JWT creation
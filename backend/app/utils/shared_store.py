@@ -0,0 +1,149 @@
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from fastapi import HTTPException
+from app.utils.csv_loader import BASE_DATA_DIR, file_version
+from app.utils.columnar import (
+    columnar_dir,
+    load_columns,
+    open_columns,
+    read_manifest,
+    read_manifest_at,
+    write_columns,
+)
+from app.utils.lazy import lazy_import
+from app.utils.locks import file_lock
+from app.utils.master_schema import read_master_csv
+from app.utils.metrics import dataset_load_duration
+from app.utils.versioned_cache import VersionedCache
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+MASTER_TABLE = "master_vehicle_data"
+
+# Numeric and date master columns materialized once per data version, in the
+# compact master schema, and memory mapped by every uvicorn worker on the host,
+# so the page cache holds a single copy:
+#   <SHARED_DATA_DIR>/<brand>/v<layout>-<mtime_ns>-<size>/manifest.json + .npy
+SHARED_DATA_DIR = Path(os.getenv("SHARED_DATA_DIR", Path(tempfile.gettempdir()) / "oem-analytics-shared"))
+# Bumped whenever the stored dtypes change, so older copies are rebuilt
+SHARED_LAYOUT_VERSION = 2
+
+# dtype kinds that can be mapped without unpickling
+_MAPPABLE_KINDS = "biufM"
+
+
+def _version_dir(brand: str, version) -> Path:
+    mtime_ns, size = version
+    return SHARED_DATA_DIR / brand.lower() / f"v{SHARED_LAYOUT_VERSION}-{mtime_ns}-{size}"
+
+
+def _remove_stale(current: Path):
+    for path in current.parent.iterdir():
+        if path != current and path.is_dir():
+            # Workers still mapping an old version keep their pages until they unmap
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def materialize(brand: str, data_dir: Path = None):
+    """
+    (directory, manifest) of a brand's memory-mappable master copy.
+
+    An ingest copy (ingest_data.py) that is up to date with the CSV, or that
+    has no CSV, is used as is. Otherwise the first worker to get the lock
+    converts the CSV's numeric and date columns and the others wait, then
+    find the copy already written.
+    """
+    data_dir = data_dir or BASE_DATA_DIR
+
+    # read_manifest ignores an ingest copy older than the CSV
+    manifest = read_manifest(brand, MASTER_TABLE, data_dir)
+    if manifest is not None:
+        return columnar_dir(brand, MASTER_TABLE, data_dir), manifest
+
+    csv_path = data_dir / brand.lower() / f"{MASTER_TABLE}.csv"
+    if not csv_path.exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"Data file not found for brand '{brand}': {MASTER_TABLE}.csv"
+        )
+
+    table_dir = _version_dir(brand, file_version(csv_path))
+    manifest = read_manifest_at(table_dir, csv_path)
+    if manifest is not None:
+        return table_dir, manifest
+
+    with file_lock(SHARED_DATA_DIR / f"{brand.lower()}.lock"):
+        manifest = read_manifest_at(table_dir, csv_path)
+        if manifest is None:
+            version = file_version(csv_path)
+            with dataset_load_duration.time(source="shared_store"):
+                df = read_master_csv(csv_path).select_dtypes(["number", "datetime"])
+                manifest = write_columns(df, table_dir, csv_path, version)
+            _remove_stale(table_dir)
+            print(f"✅ Shared {brand} master data: {manifest['rows']} rows, {len(manifest['columns'])} columns")
+
+    return table_dir, manifest
+
+
+def _open_shared(brand: str, data_dir: Path) -> dict:
+    table_dir, manifest = materialize(brand, data_dir)
+    names = [
+        col["name"] for col in manifest["columns"]
+        if np.dtype(col["dtype"]).kind in _MAPPABLE_KINDS
+    ]
+    return open_columns(table_dir, manifest, names)
+
+
+# Opened maps per brand, reused until the source version changes
+_attached = VersionedCache(max_entries=32)
+
+
+def attach(brand: str, columns=None, data_dir: Path = None) -> dict:
+    """
+    Read-only, zero-copy numeric and date master columns as {name: ndarray}.
+
+    Falls back to a private load_columns() read when the shared directory
+    cannot be written (e.g. read-only /tmp).
+    """
+    data_dir = data_dir or BASE_DATA_DIR
+    brand = brand.lower()
+    csv_path = data_dir / brand / f"{MASTER_TABLE}.csv"
+
+    if csv_path.exists():
+        version = file_version(csv_path)
+    else:
+        manifest = read_manifest(brand, MASTER_TABLE, data_dir)
+        if manifest is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Data file not found for brand '{brand}': {MASTER_TABLE}.csv"
+            )
+        version = tuple(manifest["source_version"])
+
+    try:
+        shared = _attached.get_or_build(
+            (str(data_dir), brand),
+            version,
+            lambda: _open_shared(brand, data_dir),
+        )
+    except OSError as e:
+        logger.warning("shared_store.unavailable brand=%s error=%s", brand, e)
+        return load_columns(brand, MASTER_TABLE, columns, data_dir)
+
+    names = columns if columns is not None else list(shared)
+    missing = [name for name in names if name not in shared]
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Columns not available in shared store: {', '.join(missing)}"
+        )
+    return {name: shared[name] for name in names}
+
+
+def attach_stats() -> dict:
+    return _attached.stats()
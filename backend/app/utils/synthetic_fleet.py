@@ -0,0 +1,264 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from app.utils.lazy import lazy_import
+from app.utils.rollups import (
+    MASTER_TABLE,
+    ROLLUP_COLUMNS,
+    TEMP_BAND_EDGES,
+    TEMP_BAND_LABELS,
+    band_means,
+    bin_index,
+    binned_counts,
+    binned_sums,
+    distribution,
+    finalize_views,
+    merge_partials,
+    partial_rollup,
+    write_views,
+)
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# Synthetic master telemetry with the same 41 columns as the shipped data.
+# Each brand is generated in blocks of whole vehicles and appended to its CSV,
+# so memory stays bounded however large the fleet; the derived views are
+# rolled up from the same blocks as they are written.
+
+MASTER_COLUMNS = [
+    "vehicle_id", "brand", "timestamp", "odometer_reading", "engine_temp_c",
+    "engine_rpm", "oil_pressure_psi", "coolant_temp_c", "fuel_level_percent",
+    "fuel_consumption_lph", "engine_load_percent", "throttle_pos_percent",
+    "air_flow_rate_gps", "exhaust_gas_temp_c", "vibration_level", "engine_hours",
+    "brake_fluid_level_psi", "brake_pad_wear_mm", "brake_temp_c",
+    "abs_fault_indicator", "brake_pedal_pos_percent", "wheel_speed_fl_kph",
+    "wheel_speed_fr_kph", "wheel_speed_rl_kph", "wheel_speed_rr_kph",
+    "battery_voltage_v", "battery_current_a", "battery_temp_c",
+    "alternator_output_v", "battery_charge_percent", "battery_health_percent",
+    "vehicle_speed_kph", "ambient_temp_c", "humidity_percent", "gps_latitude",
+    "gps_longitude", "engine_failure_imminent", "brake_issue_imminent",
+    "battery_issue_imminent", "failure_date", "failure_type",
+]
+
+# Sensor -> (mean, std, low, high), fitted to the shipped fleet
+SENSORS = {
+    "engine_temp_c": (95.1, 5.2, 75.0, 125.0),
+    "engine_rpm": (2010.0, 760.0, 700.0, 6000.0),
+    "oil_pressure_psi": (44.7, 10.1, 5.0, 80.0),
+    "coolant_temp_c": (89.9, 3.0, 75.0, 105.0),
+    "fuel_level_percent": (48.0, 29.0, 0.0, 100.0),
+    "fuel_consumption_lph": (5.1, 2.9, 0.0, 16.0),
+    "engine_load_percent": (40.0, 19.3, 0.0, 100.0),
+    "throttle_pos_percent": (30.0, 18.8, 0.0, 100.0),
+    "air_flow_rate_gps": (50.3, 19.7, 0.0, 110.0),
+    "exhaust_gas_temp_c": (407.5, 154.5, -70.0, 1050.0),
+    "vibration_level": (1.5, 0.56, 0.0, 8.0),
+    "brake_fluid_level_psi": (997.5, 105.2, 430.0, 1320.0),
+    "brake_pad_wear_mm": (8.07, 1.01, 5.9, 9.8),
+    "brake_temp_c": (81.6, 54.6, -85.0, 400.0),
+    "brake_pedal_pos_percent": (50.0, 28.7, 0.0, 100.0),
+    "battery_voltage_v": (12.58, 0.53, 9.0, 14.6),
+    "battery_current_a": (10.1, 21.2, -70.0, 85.0),
+    "battery_temp_c": (25.0, 5.1, 5.0, 45.0),
+    "alternator_output_v": (14.2, 0.29, 13.1, 15.3),
+    "battery_charge_percent": (70.1, 17.2, 40.0, 100.0),
+    "battery_health_percent": (94.3, 2.5, 90.0, 99.5),
+    "ambient_temp_c": (30.0, 9.9, -20.0, 50.0),
+    "humidity_percent": (59.8, 14.7, 5.0, 100.0),
+}
+
+# Per-reading probability of each imminent failure, and the labels used
+FAILURES = {
+    "engine_failure_imminent": (0.004, ["Engine Overheat", "Excessive Vibration", "Low Oil Pressure"]),
+    "brake_issue_imminent": (0.008, ["Brake Pad Worn", "Low Brake Fluid", "Brake Overheat"]),
+    "battery_issue_imminent": (0.006, ["Battery Dead", "Low Battery Voltage", "Battery Drain"]),
+}
+NO_FAILURE = "No Failure"
+NO_FAILURE_DATE = "01-01-2050 00:00"
+ABS_FAULT_RATE = 0.11
+
+BRAND_NAMES = ["Ford", "Honda", "Toyota", "BMW", "Audi", "Chevrolet", "Nissan", "Hyundai", "Kia", "Mercedes-Benz"]
+
+# Master data has no engine performance column, so synthetic fleets get their
+# engine views from this stand-in index (0–100) of engine temperature and RPM
+ENGINE_PERF_EDGES = [0, 30, 50, 70, 100]
+ENGINE_PERF_LABELS = ["Critical (0–30)", "Low (30–50)", "Moderate (50–70)", "Good (70–100)"]
+ENGINE_PERF_COLUMNS = ["ambient_temp_c", "engine_temp_c", "engine_rpm"]
+
+# Rows generated per block (rounded to whole vehicles)
+BLOCK_ROWS = 200_000
+MEAN_READING_GAP_MINUTES = 20
+
+
+def brand_names(count: int) -> list:
+    names = BRAND_NAMES[:count]
+    names += [f"Brand{i + 1:03d}" for i in range(len(names), count)]
+    return names
+
+
+def engine_performance_percent(engine_temp_c, engine_rpm):
+    perf = 212.27 - 1.4 * np.asarray(engine_temp_c, dtype=float) - 0.011 * np.asarray(engine_rpm, dtype=float)
+    return np.clip(perf, 0, 100)
+
+
+def _engine_partial(cols: dict) -> dict:
+    band = bin_index(cols["ambient_temp_c"], TEMP_BAND_EDGES)
+    perf = engine_performance_percent(cols["engine_temp_c"], cols["engine_rpm"])
+    return {
+        "band_engine_perf": binned_sums(band, perf, len(TEMP_BAND_LABELS)),
+        "engine_perf_dist": binned_counts(bin_index(perf, ENGINE_PERF_EDGES), len(ENGINE_PERF_LABELS)),
+    }
+
+
+def _synthetic_views(partial: dict) -> dict:
+    views = finalize_views(partial)
+    views["engine_temp_perf.csv"] = band_means(partial, "band_engine_perf", "avg_engine_performance_percent")
+    views["engine_perf_distribution.csv"] = distribution(partial["engine_perf_dist"], ENGINE_PERF_LABELS)
+    return views
+
+
+def _sensor(rng, name: str, n: int):
+    mean, std, low, high = SENSORS[name]
+    return np.clip(rng.normal(mean, std, n), low, high)
+
+
+def generate_block(rng, brand: str, first_vehicle: int, vehicles: int, timestamps: int, start, id_width: int) -> "pd.DataFrame":
+    """
+    Readings for `vehicles` consecutive vehicles, `timestamps` each, sorted by
+    (vehicle_id, timestamp).
+    """
+    n = vehicles * timestamps
+    cols = {}
+
+    ids = np.array([f"VEH{i:0{id_width}d}" for i in range(first_vehicle, first_vehicle + vehicles)])
+    cols["vehicle_id"] = np.repeat(ids, timestamps)
+    cols["brand"] = np.full(n, brand)
+
+    # Irregular reading intervals, accumulated per vehicle
+    gaps = rng.exponential(MEAN_READING_GAP_MINUTES, (vehicles, timestamps)).astype("int64")
+    gaps[:, 0] = 0
+    minutes = np.cumsum(gaps, axis=1).ravel()
+    when = np.datetime64(start, "m") + minutes.astype("timedelta64[m]")
+    cols["timestamp"] = pd.DatetimeIndex(when).strftime("%Y-%m-%d %H:%M:%S")
+
+    for name in SENSORS:
+        cols[name] = _sensor(rng, name, n)
+
+    speed = np.clip(rng.normal(70.2, 38.2, n), 0, 180)
+    cols["vehicle_speed_kph"] = speed
+    for wheel in ("fl", "fr", "rl", "rr"):
+        cols[f"wheel_speed_{wheel}_kph"] = speed * 0.86 + rng.normal(0, 30, n)
+
+    # Odometer and engine hours grow monotonically per vehicle
+    hours = (gaps / 60.0).ravel()
+    odometer_base = np.repeat(rng.uniform(10_000, 100_000, vehicles), timestamps)
+    hours_base = np.repeat(rng.uniform(500, 5_000, vehicles), timestamps)
+    cols["odometer_reading"] = odometer_base + np.cumsum((speed * hours).reshape(vehicles, timestamps), axis=1).ravel()
+    cols["engine_hours"] = hours_base + np.cumsum(hours.reshape(vehicles, timestamps), axis=1).ravel()
+
+    cols["abs_fault_indicator"] = (rng.random(n) < ABS_FAULT_RATE).astype("int64")
+    cols["gps_latitude"] = rng.uniform(28.0, 35.0, n)
+    cols["gps_longitude"] = rng.uniform(75.0, 85.0, n)
+
+    # At most one imminent failure per reading, with matching sensor symptoms
+    draw = rng.random(n)
+    failure_type = np.full(n, NO_FAILURE, dtype=object)
+    threshold = 0.0
+    for flag, (rate, labels) in FAILURES.items():
+        hit = (draw >= threshold) & (draw < threshold + rate)
+        threshold += rate
+        cols[flag] = hit.astype("int64")
+        failure_type[hit] = rng.choice(labels, int(hit.sum()))
+    cols["engine_temp_c"] = cols["engine_temp_c"] + cols["engine_failure_imminent"] * 15
+    cols["battery_voltage_v"] = cols["battery_voltage_v"] - cols["battery_issue_imminent"] * 1.5
+    cols["brake_pad_wear_mm"] = np.minimum(cols["brake_pad_wear_mm"] + cols["brake_issue_imminent"] * 1.0, 9.8)
+
+    failing = failure_type != NO_FAILURE
+    failure_date = np.full(n, NO_FAILURE_DATE, dtype=object)
+    if failing.any():
+        due = when[failing] + rng.integers(1, 8, int(failing.sum())).astype("timedelta64[D]")
+        failure_date[failing] = pd.DatetimeIndex(due).strftime("%d-%m-%Y %H:%M")
+    cols["failure_date"] = failure_date
+    cols["failure_type"] = failure_type
+
+    return pd.DataFrame(cols)[MASTER_COLUMNS]
+
+
+def generate_brand(
+    brand: str,
+    out_dir: Path,
+    vehicles: int,
+    timestamps: int,
+    seed: int = 0,
+    brand_index: int = 0,
+    start: str = "2023-01-01",
+    derived: bool = True,
+) -> dict:
+    """
+    Write <out_dir>/<brand>/master_vehicle_data.csv block by block (and the
+    nine derived views). Output depends only on the arguments, not on memory
+    or worker count. Returns {"rows": ..., "bytes": ...}.
+    """
+    brand_dir = out_dir / brand.lower()
+    brand_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = brand_dir / f"{MASTER_TABLE}.csv"
+    tmp_path = brand_dir / f".{MASTER_TABLE}.csv.tmp"
+
+    id_width = max(4, len(str(vehicles)))
+    per_block = max(1, BLOCK_ROWS // max(1, timestamps))
+
+    rows = 0
+    partial = None
+    with open(tmp_path, "w", newline="") as f:
+        for block_index, first in enumerate(range(0, vehicles, per_block)):
+            # One generator per block keeps output independent of run order
+            rng = np.random.default_rng([seed, brand_index, block_index])
+            count = min(per_block, vehicles - first)
+            df = generate_block(rng, brand, first + 1, count, timestamps, start, id_width)
+            df.to_csv(f, header=block_index == 0, index=False, float_format="%.10g")
+            rows += len(df)
+
+            if derived:
+                cols = {name: df[name].to_numpy() for name in set(ROLLUP_COLUMNS) | set(ENGINE_PERF_COLUMNS)}
+                block = {**partial_rollup(cols), **_engine_partial(cols)}
+                partial = block if partial is None else merge_partials(partial, block)
+
+        if rows == 0:
+            f.write(",".join(MASTER_COLUMNS) + "\n")
+
+    tmp_path.replace(csv_path)
+
+    if derived:
+        if partial is None:
+            cols = {name: np.array([]) for name in set(ROLLUP_COLUMNS) | set(ENGINE_PERF_COLUMNS)}
+            partial = {**partial_rollup(cols), **_engine_partial(cols)}
+        write_views(brand_dir, _synthetic_views(partial))
+
+    return {"rows": rows, "bytes": csv_path.stat().st_size}
+
+
+def generate_fleet(
+    brands,
+    out_dir: Path,
+    vehicles: int,
+    timestamps: int,
+    seed: int = 0,
+    start: str = "2023-01-01",
+    derived: bool = True,
+    max_workers: int = None,
+) -> dict:
+    """
+    Generate several brands, one brand per worker process.
+    """
+    brands = list(brands)
+    args = [
+        (brand, out_dir, vehicles, timestamps, seed, index, start, derived)
+        for index, brand in enumerate(brands)
+    ]
+
+    if max_workers == 1 or len(brands) <= 1:
+        return {brand: generate_brand(*a) for brand, a in zip(brands, args)}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(generate_brand, *zip(*args))
+        return dict(zip(brands, results))
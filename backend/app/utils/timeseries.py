@@ -0,0 +1,176 @@
+from fastapi import HTTPException
+from app.utils.columnar import table_version
+from app.utils.lazy import lazy_import
+from app.utils.vehicle_index import MASTER_TABLE, as_datetime64, get_vehicle_index
+from app.utils.versioned_cache import VersionedCache
+
+np = lazy_import("numpy")
+
+# Sensor history downsampled for charts. A series (one vehicle, or the whole
+# brand in time order) is reduced to at most `points` values, so the payload
+# is bounded whatever the fleet size or time range:
+#   buckets - equal-width time buckets with mean/min/max/count
+#   lttb    - Largest-Triangle-Three-Buckets, real readings that keep the shape
+
+METHODS = ("buckets", "lttb")
+
+_time_orders = VersionedCache(max_entries=16)
+_series = VersionedCache(max_entries=512)
+
+
+def _time_order(brand: str, index, version) -> "np.ndarray":
+    # The index is sorted by vehicle; fleet-wide series need time order
+    return _time_orders.get_or_build(
+        brand,
+        version,
+        lambda: np.argsort(index.timestamps, kind="stable"),
+    )
+
+
+def _check_column(index, column: str):
+    if column not in index.frame.columns:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown column: {column}"
+        )
+    if index.frame[column].dtype.kind not in "biuf":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Not a numeric column: {column}"
+        )
+
+
+def _format_times(times: "np.ndarray") -> list:
+    return np.char.replace(np.datetime_as_string(times, unit="s"), "T", " ").tolist()
+
+
+def bucket_series(times: "np.ndarray", values: "np.ndarray", points: int) -> dict:
+    """
+    Mean/min/max/count of time-sorted readings in `points` equal-width time
+    buckets (empty buckets are left out).
+    """
+    ticks = times.astype("datetime64[ns]").astype("int64")
+    first, last = int(ticks[0]), int(ticks[-1])
+    width = max(1, -(-(last - first + 1) // points))
+
+    bucket = (ticks - first) // width
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    counts = np.diff(np.r_[starts, len(values)])
+
+    return {
+        "timestamp": _format_times((first + bucket[starts] * width).astype("datetime64[ns]")),
+        "mean": (np.add.reduceat(values, starts) / counts).tolist(),
+        "min": np.minimum.reduceat(values, starts).tolist(),
+        "max": np.maximum.reduceat(values, starts).tolist(),
+        "count": counts.tolist(),
+    }
+
+
+def lttb_indices(x: "np.ndarray", y: "np.ndarray", points: int) -> "np.ndarray":
+    """
+    Positions of the `points` readings chosen by Largest-Triangle-Three-Buckets.
+
+    Buckets are chosen sequentially (each depends on the previous pick), but
+    every bucket is scored with one vectorized pass over its readings.
+    """
+    n = len(x)
+    if points >= n or points < 3:
+        return np.arange(n) if points >= n else np.unique([0, n - 1])[:points]
+
+    # Inner buckets split readings 1..n-2; the first and last readings are kept
+    edges = np.linspace(1, n - 1, points - 1).astype("int64")
+    # Average point of each bucket, used as the third triangle corner
+    sums_x = np.add.reduceat(x[:n - 1], edges[:-1])
+    sums_y = np.add.reduceat(y[:n - 1], edges[:-1])
+    sizes = np.diff(edges)
+    avg_x = np.r_[sums_x / sizes, x[-1]]
+    avg_y = np.r_[sums_y / sizes, y[-1]]
+
+    chosen = np.empty(points, dtype="int64")
+    chosen[0] = 0
+    chosen[-1] = n - 1
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i + 1]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y[i + 1] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        chosen[i + 1] = a
+    return chosen
+
+
+def _build(brand: str, index, version, column: str, vehicle_id, start, end, points: int, method: str) -> dict:
+    if vehicle_id is not None:
+        bounds = index.row_range(vehicle_id, start, end)
+        if bounds is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Vehicle '{vehicle_id}' not found for brand '{brand}'"
+            )
+        rows = np.arange(*bounds)
+    else:
+        rows = _time_order(brand, index, version)
+        if start is not None or end is not None:
+            times = index.timestamps[rows]
+            lo = np.searchsorted(times, as_datetime64(start), side="left") if start is not None else 0
+            hi = np.searchsorted(times, as_datetime64(end), side="right") if end is not None else len(rows)
+            rows = rows[lo:max(lo, hi)]
+
+    times = index.timestamps[rows]
+    values = index.frame[column].to_numpy(dtype="float64")[rows]
+    keep = ~np.isnan(values)
+    times, values = times[keep], values[keep]
+
+    result = {
+        "brand": brand,
+        "column": column,
+        "vehicle_id": vehicle_id,
+        "method": method,
+        "total_readings": int(len(values)),
+    }
+
+    if len(values) == 0:
+        result["points"] = []
+    elif method == "lttb":
+        ticks = times.astype("datetime64[ns]").astype("int64")
+        chosen = lttb_indices(ticks.astype("float64"), values, points)
+        result["points"] = [
+            {"timestamp": t, "value": v}
+            for t, v in zip(_format_times(times[chosen]), values[chosen].tolist())
+        ]
+    else:
+        buckets = bucket_series(times, values, points)
+        result["points"] = [
+            dict(zip(buckets, row)) for row in zip(*buckets.values())
+        ]
+
+    return result
+
+
+def get_timeseries(brand: str, column: str, vehicle_id=None, start=None, end=None, points: int = 500, method: str = "buckets") -> dict:
+    """
+    Downsampled series of a master column, cached per query and data version.
+    """
+    brand = brand.lower()
+    if method not in METHODS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown method: {method}. Use {', '.join(METHODS)}"
+        )
+
+    index = get_vehicle_index(brand)
+    _check_column(index, column)
+    version = table_version(brand, MASTER_TABLE)
+
+    key = (brand, column, vehicle_id, start, end, points, method)
+    return _series.get_or_build(
+        key,
+        version,
+        lambda: _build(brand, index, version, column, vehicle_id, start, end, points, method),
+    )
+
+
+def timeseries_cache_stats() -> dict:
+    return _series.stats()
@@ -0,0 +1,103 @@
+from fastapi import HTTPException
+from app.utils.columnar import load_table, table_version
+from app.utils.lazy import lazy_import
+from app.utils.versioned_cache import VersionedCache
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+MASTER_TABLE = "master_vehicle_data"
+
+
+def as_datetime64(value):
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.to_datetime64()
+
+
+class VehicleIndex:
+    """
+    Master telemetry sorted by (vehicle_id, timestamp).
+
+    Every vehicle owns a contiguous [start, end) row range, so looking up a
+    vehicle is a binary search over the sorted ids plus a slice, and a time
+    window is a second binary search inside that range.
+    """
+
+    def __init__(self, frame: "pd.DataFrame"):
+        timestamps = pd.to_datetime(frame["timestamp"]).to_numpy()
+        codes, uniques = pd.factorize(frame["vehicle_id"], sort=True)
+        order = np.lexsort((timestamps, codes))
+
+        self.frame = frame.take(order).reset_index(drop=True)
+        self.timestamps = timestamps[order]
+
+        counts = np.bincount(codes, minlength=len(uniques))
+        self.vehicle_ids = np.asarray(uniques, dtype=str)
+        self.ends = np.cumsum(counts)
+        self.starts = self.ends - counts
+
+    def __len__(self):
+        return len(self.vehicle_ids)
+
+    def vehicles(self, offset: int = 0, limit: int = 100) -> list:
+        stop = min(offset + limit, len(self.vehicle_ids))
+        return [
+            {
+                "vehicle_id": str(self.vehicle_ids[i]),
+                "records": int(self.ends[i] - self.starts[i]),
+                "first_timestamp": str(pd.Timestamp(self.timestamps[self.starts[i]])),
+                "last_timestamp": str(pd.Timestamp(self.timestamps[self.ends[i] - 1])),
+            }
+            for i in range(offset, stop)
+        ]
+
+    def row_range(self, vehicle_id: str, start=None, end=None):
+        """
+        (first, last) row positions for a vehicle, optionally clipped to
+        [start, end]. Returns None for an unknown vehicle.
+        """
+        i = int(np.searchsorted(self.vehicle_ids, vehicle_id))
+        if i >= len(self.vehicle_ids) or self.vehicle_ids[i] != vehicle_id:
+            return None
+
+        first, last = int(self.starts[i]), int(self.ends[i])
+        window = self.timestamps[first:last]
+
+        if start is not None:
+            first += int(np.searchsorted(window, as_datetime64(start), side="left"))
+        if end is not None:
+            last = int(self.starts[i]) + int(np.searchsorted(window, as_datetime64(end), side="right"))
+
+        return first, max(first, last)
+
+    def rows(self, first: int, last: int) -> list:
+        return self.frame.iloc[first:last].to_dict(orient="records")
+
+
+_index_cache = VersionedCache(max_entries=16)
+
+
+def get_vehicle_index(brand: str) -> VehicleIndex:
+    """
+    Index for a brand, rebuilt only when its master data changes.
+    """
+    brand = brand.lower()
+    try:
+        version = table_version(brand, MASTER_TABLE)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Data not available for brand '{brand}'"
+        )
+
+    return _index_cache.get_or_build(
+        brand,
+        version,
+        lambda: VehicleIndex(load_table(brand, MASTER_TABLE)),
+    )
+
+
+def index_cache_stats() -> dict:
+    return _index_cache.stats()
@@ -0,0 +1,170 @@
+from pathlib import Path
+from fastapi import HTTPException
+from app.utils.csv_loader import BASE_DATA_DIR, data_file, file_version, load_frame
+from app.utils.lazy import lazy_import
+from app.utils.versioned_cache import VersionedCache
+
+pd = lazy_import("pandas")
+
+
+class ViewSchema:
+    """
+    Layout of one derived CSV and how it is served.
+
+    `header` is the header row in the file, `columns` the (name, type) pairs
+    the parsed columns must have, named as pandas reads them (a duplicated
+    "count,count" header becomes count, count.1), and `build` turns the
+    typed columns into the response object.
+    """
+
+    def __init__(self, header: list, columns: list, build):
+        self.header = header
+        self.columns = columns
+        self.build = build
+
+    def parse(self, df: "pd.DataFrame") -> dict:
+        """
+        Typed columns as {name: list}. Raises ValueError on a malformed file.
+        """
+        names = [name for name, _ in self.columns]
+        # pandas suffixes duplicated headers (count, count.1), as `names` does
+        if list(df.columns) != names:
+            raise ValueError(f"expected header {','.join(self.header)}, got {','.join(map(str, df.columns))}")
+
+        parsed = {}
+        for name, kind in self.columns:
+            series = df[name]
+            if series.isna().any():
+                raise ValueError(f"missing values in column {name}")
+            if kind is str:
+                parsed[name] = [str(v) for v in series]
+            elif kind is int:
+                if not pd.api.types.is_integer_dtype(series.dtype):
+                    raise ValueError(f"column {name} is not integer")
+                parsed[name] = series.astype("int64").tolist()
+            else:
+                if not pd.api.types.is_numeric_dtype(series.dtype):
+                    raise ValueError(f"column {name} is not numeric")
+                parsed[name] = series.astype("float64").tolist()
+        return parsed
+
+
+def _records(columns: dict) -> list:
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+def _brake_temp_performance(columns: dict) -> list:
+    return [
+        {"temperature": band, "wear": round(value, 2)}
+        for band, value in zip(columns["temp_band"], columns["avg_brake_temp_c"])
+    ]
+
+
+def _labelled_counts(columns: dict) -> list:
+    return [
+        {"label": label, "value": value}
+        for label, value in zip(columns["count"], columns["count.1"])
+    ]
+
+
+def _brake_risk(columns: dict) -> dict:
+    if not columns["brake_issue_imminent"]:
+        raise ValueError("no rows")
+    risk_flag = columns["brake_issue_imminent"][0]
+    return {
+        "risk": "High Risk" if risk_flag == 1 else "Low Risk",
+        "confidence": round(columns["fraction"][0] * 100, 0),
+    }
+
+
+# Distributions carry a duplicated "count,count" header; the second column is
+# served as "count.1", as pandas has always named it
+_DISTRIBUTION = dict(header=["count", "count"], columns=[("count", str), ("count.1", int)])
+
+
+def _band_means(value_column: str, build=_records) -> ViewSchema:
+    return ViewSchema(
+        header=["temp_band", value_column],
+        columns=[("temp_band", str), (value_column, float)],
+        build=build,
+    )
+
+
+def _risk_summary(flag: str, build=_records) -> ViewSchema:
+    return ViewSchema(
+        header=[flag, "fraction"],
+        columns=[(flag, int), ("fraction", float)],
+        build=build,
+    )
+
+
+VIEW_SCHEMAS = {
+    "engine_temp_perf.csv": _band_means("avg_engine_performance_percent"),
+    "engine_perf_distribution.csv": ViewSchema(**_DISTRIBUTION, build=_records),
+    "engine_risk_summary.csv": _risk_summary("engine_failure_imminent"),
+    "battery_temp_perf.csv": _band_means("avg_battery_health_percent"),
+    "battery_health_distribution.csv": ViewSchema(**_DISTRIBUTION, build=_records),
+    "battery_risk_summary.csv": _risk_summary("battery_issue_imminent"),
+    "brake_temp_perf.csv": _band_means("avg_brake_temp_c", _brake_temp_performance),
+    "brake_wear_distribution.csv": ViewSchema(**_DISTRIBUTION, build=_labelled_counts),
+    "brake_risk_summary.csv": _risk_summary("brake_issue_imminent", _brake_risk),
+}
+
+_responses = VersionedCache(max_entries=256)
+
+
+def _build_response(brand: str, filename: str, path: Path):
+    schema = VIEW_SCHEMAS[filename]
+    try:
+        # Parsed through csv_loader's cache; only the typed response is kept here
+        return schema.build(schema.parse(load_frame(brand, filename)))
+    except ValueError as e:
+        print(f"❌ Malformed data file {path}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Malformed data file '{filename}': {e}"
+        )
+    except HTTPException as e:
+        print(f"❌ Unreadable data file {path}: {e.detail}")
+        raise
+
+
+def load_view(brand: str, filename: str):
+    """
+    Ready-to-serve response for a derived file, validated and built once per
+    file version. The object is shared between requests and must not be mutated.
+    """
+    path = data_file(brand, filename)
+    return _responses.get_or_build(
+        (brand.lower(), filename),
+        file_version(path),
+        lambda: _build_response(brand, filename, path),
+    )
+
+
+def validate_views() -> list:
+    """
+    Load every derived file of every brand (called at startup), so a malformed
+    file is reported before it is requested. Returns the failures as
+    "brand/filename: detail" strings.
+    """
+    if not BASE_DATA_DIR.exists():
+        return []
+
+    failures = []
+    for brand_dir in sorted(BASE_DATA_DIR.iterdir()):
+        if not brand_dir.is_dir():
+            continue
+        for filename in VIEW_SCHEMAS:
+            if not (brand_dir / filename).exists():
+                continue
+            try:
+                load_view(brand_dir.name, filename)
+            except HTTPException as e:
+                failures.append(f"{brand_dir.name}/{filename}: {e.detail}")
+    return failures
+
+
+def view_cache_stats() -> dict:
+    return _responses.stats()
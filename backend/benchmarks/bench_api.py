@@ -0,0 +1,267 @@
+"""
+Latency and throughput of the API endpoints, served in-process.
+
+Logs in one user per brand, then fires each endpoint at a fixed concurrency
+and reports p50/p95/p99 latency and requests/sec. Results can be saved as
+JSON and compared with an earlier run.
+
+Run from the backend directory:
+    python -m benchmarks.bench_api --requests 200 --concurrency 16
+    python -m benchmarks.bench_api --json-out after.json --baseline before.json --max-regression 0.2
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_DATA_DIR = BACKEND_DIR / "data" / "processed"
+
+BENCH_PASSWORD = "bench-password"
+
+# name -> (method, path template, payload template); {brand} is filled per request
+ENDPOINTS = {
+    "auth_login": ("POST", "/auth/login", {"email": "{brand}_admin@oem.com", "password": BENCH_PASSWORD, "brand": "{brand}"}),
+    "ranking": ("GET", "/ranking", None),
+    "summary": ("GET", "/{brand}/summary", None),
+    "engine_temp_performance": ("GET", "/{brand}/engine/temp-performance", None),
+    "engine_distribution": ("GET", "/{brand}/engine/distribution", None),
+    "engine_risk": ("GET", "/{brand}/engine/risk", None),
+    "battery_temp_performance": ("GET", "/{brand}/battery/temp-performance", None),
+    "battery_distribution": ("GET", "/{brand}/battery/distribution", None),
+    "battery_risk": ("GET", "/{brand}/battery/risk", None),
+    "brakes_temp_performance": ("GET", "/{brand}/brakes/temp-performance", None),
+    "brakes_wear_distribution": ("GET", "/{brand}/brakes/wear-distribution", None),
+    "brakes_risk": ("GET", "/{brand}/brakes/risk", None),
+    "mcp_query": ("POST", "/mcp/query", {"question": "How is the engine health?", "brand": "{brand}"}),
+}
+
+
+def _prepare_environment(data_dir: Path) -> Path:
+    """
+    Scratch working directory for the app.
+
+    BASE_DATA_DIR is derived from the working directory (<cwd>/data/processed),
+    so the benchmark runs from a temp dir whose data/processed points at
+    data_dir, with its own SQLite database.
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_api_"))
+    (work_dir / "data").mkdir()
+    (work_dir / "data" / "processed").symlink_to(data_dir.resolve(), target_is_directory=True)
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{work_dir / 'bench.db'}")
+    os.chdir(work_dir)
+    sys.path.insert(0, str(BACKEND_DIR))
+    return work_dir
+
+
+def _seed_users(brands):
+    from app.db import SessionLocal, User, init_tables
+    from app.utils.security import hash_passwords
+
+    init_tables()
+    db = SessionLocal()
+    try:
+        emails = [f"{brand}_admin@oem.com" for brand in brands]
+        existing = {email for (email,) in db.query(User.email).filter(User.email.in_(emails))}
+        missing = [(email, brand) for email, brand in zip(emails, brands) if email not in existing]
+        hashes = hash_passwords([BENCH_PASSWORD] * len(missing))
+        db.add_all([
+            User(email=email, password_hash=password_hash, brand=brand)
+            for (email, brand), password_hash in zip(missing, hashes)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def _fill(template, brand: str):
+    if isinstance(template, dict):
+        return {key: _fill(value, brand) for key, value in template.items()}
+    if isinstance(template, str):
+        return template.replace("{brand}", brand)
+    return template
+
+
+def _percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+async def _bench_endpoint(client, name: str, brands, tokens: dict, requests: int, concurrency: int) -> dict:
+    method, path, payload = ENDPOINTS[name]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    statuses = {}
+
+    async def one(i: int):
+        brand = brands[i % len(brands)]
+        headers = None if name == "auth_login" else {"Authorization": f"Bearer {tokens[brand]}"}
+        async with semaphore:
+            started = time.perf_counter()
+            r = await client.request(method, _fill(path, brand), json=_fill(payload, brand), headers=headers)
+            latencies.append(time.perf_counter() - started)
+        statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+
+    # Warm caches once per brand before timing
+    await asyncio.gather(*(one(i) for i in range(len(brands))))
+    latencies.clear()
+    statuses.clear()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 4),
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "status_counts": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+async def _run(app, names, brands, requests: int, login_requests: int, concurrency: int) -> dict:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        tokens = {}
+        for brand in brands:
+            r = await client.post(
+                "/auth/login",
+                json={"email": f"{brand}_admin@oem.com", "password": BENCH_PASSWORD, "brand": brand},
+            )
+            r.raise_for_status()
+            tokens[brand] = r.json()["access_token"]
+
+        results = {}
+        for name in names:
+            count = login_requests if name == "auth_login" else requests
+            results[name] = await _bench_endpoint(client, name, brands, tokens, count, concurrency)
+            r = results[name]
+            print(
+                f"{name:<26} p50 {r['p50_ms']:9.2f} ms  p95 {r['p95_ms']:9.2f} ms  "
+                f"p99 {r['p99_ms']:9.2f} ms  {r['throughput_rps']:9.1f} req/s  errors {r['errors']}",
+                file=sys.stderr,
+            )
+        return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list:
+    """
+    Endpoints whose p95 grew by more than max_regression (a fraction) over
+    the baseline run.
+    """
+    regressions = []
+    for name, result in report["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(name)
+        if not before or not before["p95_ms"]:
+            continue
+        change = result["p95_ms"] / before["p95_ms"] - 1
+        if change > max_regression:
+            regressions.append({
+                "endpoint": name,
+                "baseline_p95_ms": before["p95_ms"],
+                "p95_ms": result["p95_ms"],
+                "change": round(change, 4),
+            })
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API endpoint latency and throughput")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    parser.add_argument("--brands", help="Comma-separated brands (default: every brand in --data-dir)")
+    parser.add_argument("--endpoints", help=f"Comma-separated subset of: {', '.join(ENDPOINTS)}")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per endpoint")
+    parser.add_argument("--login-requests", type=int, default=20, help="Timed requests for auth_login (bcrypt bound)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--json-out", type=Path, help="Write the report to this file")
+    parser.add_argument("--baseline", type=Path, help="Earlier --json-out report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed p95 growth vs baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if not args.data_dir.exists():
+        parser.error(f"data directory not found: {args.data_dir}")
+
+    names = [n.strip() for n in args.endpoints.split(",")] if args.endpoints else list(ENDPOINTS)
+    unknown = [n for n in names if n not in ENDPOINTS]
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(unknown)}")
+
+    brands = (
+        [b.strip().lower() for b in args.brands.split(",") if b.strip()]
+        if args.brands
+        else sorted(d.name for d in args.data_dir.iterdir() if d.is_dir())
+    )
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    json_out = args.json_out.resolve() if args.json_out else None
+
+    # The app logs with print(); keep stdout for the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        _prepare_environment(args.data_dir)
+        from app.main import app
+
+        _seed_users(brands)
+        results = asyncio.run(_run(app, names, brands, args.requests, args.login_requests, args.concurrency))
+
+    report = {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "cpus": os.cpu_count(),
+        "brands": brands,
+        "concurrency": args.concurrency,
+        "endpoints": results,
+    }
+
+    failed = False
+    if baseline is not None:
+        regressions = compare(report, baseline, args.max_regression)
+        report["baseline_revision"] = baseline.get("revision")
+        report["regressions"] = regressions
+        for r in regressions:
+            print(
+                f"❌ {r['endpoint']}: p95 {r['baseline_p95_ms']:.2f} -> {r['p95_ms']:.2f} ms "
+                f"(+{r['change'] * 100:.1f}%, limit {args.max_regression * 100:.0f}%)",
+                file=sys.stderr,
+            )
+        failed = bool(regressions)
+
+    output = json.dumps(report, indent=2)
+    if json_out:
+        json_out.write_text(output)
+    print(output)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
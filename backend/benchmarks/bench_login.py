@@ -0,0 +1,78 @@
+"""
+Login throughput at different bcrypt pool sizes.
+
+Run from the backend directory:
+    python -m benchmarks.bench_login --pool-sizes 1,2,4 --logins 64 --concurrency 32
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Isolated database so the benchmark never touches users.db
+_tmp_dir = tempfile.mkdtemp(prefix="bench_login_")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(_tmp_dir) / 'bench.db'}")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx  # noqa: E402
+from app.main import app  # noqa: E402
+from app.db import SessionLocal, User, init_tables  # noqa: E402
+from app.utils.security import configure_password_pool, hash_password, BCRYPT_ROUNDS  # noqa: E402
+
+BENCH_EMAIL = "bench_admin@oem.com"
+BENCH_PASSWORD = "bench-password"
+BENCH_BRAND = "bench"
+
+
+def _ensure_user():
+    init_tables()
+    db = SessionLocal()
+    try:
+        if not db.query(User).filter(User.email == BENCH_EMAIL).first():
+            db.add(User(email=BENCH_EMAIL, password_hash=hash_password(BENCH_PASSWORD), brand=BENCH_BRAND))
+            db.commit()
+    finally:
+        db.close()
+
+
+async def _run(logins: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    payload = {"email": BENCH_EMAIL, "password": BENCH_PASSWORD, "brand": BENCH_BRAND}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                r = await client.post("/auth/login", json=payload)
+                r.raise_for_status()
+
+        # Warm the worker processes before timing
+        await one()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(logins)))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /auth/login throughput")
+    parser.add_argument("--pool-sizes", default=f"1,{os.cpu_count() or 1}")
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    _ensure_user()
+
+    print(f"bcrypt rounds={BCRYPT_ROUNDS} logins={args.logins} concurrency={args.concurrency} cpus={os.cpu_count()}")
+    for size in [int(s) for s in args.pool_sizes.split(",") if s.strip()]:
+        configure_password_pool(size)
+        elapsed = asyncio.run(_run(args.logins, args.concurrency))
+        print(f"pool={size:>3}  {args.logins / elapsed:8.1f} logins/sec  ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Memory footprint of master telemetry per brand: default pandas parsing vs the
+compact schema in app/utils/master_schema.py.
+
+Run from the backend directory:
+    python -m benchmarks.memory_footprint
+    python -m benchmarks.memory_footprint ford toyota --data-dir ../data/processed --json
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.aggregates import FLAG_COLUMNS, MASTER_TABLE
+from app.utils.master_schema import frame_footprint, read_master_csv
+
+
+def _flag_means_seconds(df: pd.DataFrame, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for name in FLAG_COLUMNS:
+            df[name].mean()
+    return (time.perf_counter() - started) / repeat
+
+
+def measure_brand(csv_path: Path, repeat: int) -> dict:
+    default = pd.read_csv(csv_path)
+    compact = read_master_csv(csv_path)
+
+    default_bytes = frame_footprint(default)
+    compact_bytes = frame_footprint(compact)
+    default_total = sum(default_bytes.values())
+    compact_total = sum(compact_bytes.values())
+
+    columns = sorted(
+        (
+            {
+                "column": name,
+                "default_dtype": str(default[name].dtype),
+                "compact_dtype": str(compact[name].dtype),
+                "default_bytes": default_bytes[name],
+                "compact_bytes": compact_bytes[name],
+            }
+            for name in default.columns
+        ),
+        key=lambda c: c["default_bytes"] - c["compact_bytes"],
+        reverse=True,
+    )
+
+    return {
+        "rows": len(default),
+        "default_bytes": default_total,
+        "compact_bytes": compact_total,
+        "reduction": round(default_total / compact_total, 2) if compact_total else None,
+        "flag_means_ms": {
+            "default": round(_flag_means_seconds(default, repeat) * 1000, 4),
+            "compact": round(_flag_means_seconds(compact, repeat) * 1000, 4),
+        },
+        "columns": columns,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare master telemetry memory footprint per brand")
+    parser.add_argument("brands", nargs="*", help="Brands to measure (default: all)")
+    parser.add_argument("--data-dir", type=Path, default=BASE_DATA_DIR)
+    parser.add_argument("--repeat", type=int, default=50, help="Repetitions of the flag-mean timing")
+    parser.add_argument("--top", type=int, default=5, help="Columns listed per brand")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    brands = args.brands
+    if not brands and args.data_dir.exists():
+        brands = sorted(d.name for d in args.data_dir.iterdir() if (d / f"{MASTER_TABLE}.csv").exists())
+
+    report = {}
+    for brand in brands:
+        csv_path = args.data_dir / brand.lower() / f"{MASTER_TABLE}.csv"
+        if not csv_path.exists():
+            print(f"⚠️  {brand}: {csv_path} not found")
+            continue
+        report[brand] = measure_brand(csv_path, args.repeat)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    total_default = sum(r["default_bytes"] for r in report.values())
+    total_compact = sum(r["compact_bytes"] for r in report.values())
+
+    print(f"{'brand':<16} {'rows':>9} {'default KiB':>12} {'compact KiB':>12} {'x':>6} {'flag means ms':>16}")
+    for brand, r in report.items():
+        means = f"{r['flag_means_ms']['default']:.3f}/{r['flag_means_ms']['compact']:.3f}"
+        print(
+            f"{brand:<16} {r['rows']:>9} {r['default_bytes'] / 1024:>12.1f} "
+            f"{r['compact_bytes'] / 1024:>12.1f} {r['reduction']:>6} {means:>16}"
+        )
+        for c in r["columns"][:args.top]:
+            print(f"    {c['column']:<28} {c['default_dtype']:>10} -> {c['compact_dtype']:<14} "
+                  f"{c['default_bytes'] / 1024:.1f} -> {c['compact_bytes'] / 1024:.1f} KiB")
+
+    if total_compact:
+        print(f"📊 Total: {total_default / 1024:.1f} KiB -> {total_compact / 1024:.1f} KiB "
+              f"({total_default / total_compact:.2f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Import-time breakdown for the FastAPI app, with an optional budget check.
+
+Run from the backend directory:
+    python -m benchmarks.startup_profile --top 20
+    python -m benchmarks.startup_profile --max-seconds 1.0   # exits 1 if over budget
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Modules that must stay out of `import app.main` (loaded on first use)
+LAZY_MODULES = ["pandas", "numpy", "sqlalchemy", "passlib", "jose.jwt"]
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def profile_once(module: str) -> dict:
+    """
+    Import `module` in a fresh interpreter with -X importtime.
+    """
+    code = (
+        "import json, sys, time\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - t\n"
+        f"print(json.dumps({{'seconds': elapsed, 'lazy_loaded': [m for m in {LAZY_MODULES!r} if m in sys.modules]}}))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    modules = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append({
+                "module": name,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": len(indent) // 2,
+            })
+    result["modules"] = modules
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile import time of the API")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters to sample (median is reported)")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-seconds", type=float, default=float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "0")) or None)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    runs = [profile_once(args.module) for _ in range(args.runs)]
+    median_seconds = statistics.median(run["seconds"] for run in runs)
+    fastest = min(runs, key=lambda run: run["seconds"])
+
+    top_level = sorted(
+        (m for m in fastest["modules"] if m["depth"] <= 1),
+        key=lambda m: m["cumulative_ms"],
+        reverse=True,
+    )[:args.top]
+
+    report = {
+        "module": args.module,
+        "runs": args.runs,
+        "median_seconds": round(median_seconds, 4),
+        "max_seconds": args.max_seconds,
+        "eagerly_loaded_lazy_modules": fastest["lazy_loaded"],
+        "top_imports": top_level,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import {args.module}: median {median_seconds * 1000:.1f} ms over {args.runs} runs")
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for m in top_level:
+            print(f"{m['cumulative_ms']:14.1f} {m['self_ms']:9.1f}  {'  ' * m['depth']}{m['module']}")
+        if fastest["lazy_loaded"]:
+            print(f"⚠️  Loaded at import (should be lazy): {', '.join(fastest['lazy_loaded'])}")
+
+    failed = False
+    if args.max_seconds is not None and median_seconds > args.max_seconds:
+        print(f"❌ import time {median_seconds:.3f}s exceeds budget {args.max_seconds}s", file=sys.stderr)
+        failed = True
+    if args.max_seconds is not None and fastest["lazy_loaded"]:
+        print(f"❌ heavy modules imported eagerly: {', '.join(fastest['lazy_loaded'])}", file=sys.stderr)
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,12 @@
 from pathlib import Path
-from app.db import SessionLocal, User
+from app.db import SessionLocal, User, init_tables
 from app.utils.security import hash_password
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 DATA_DIR = BASE_DIR / "data" / "processed"
 
 def main():
+    init_tables()
     db = SessionLocal()
 
     # Check if data directory exists
@@ -0,0 +1,47 @@
+import argparse
+import time
+from pathlib import Path
+from app.utils.synthetic_fleet import brand_names, generate_fleet
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic fleet telemetry (master + derived views) for scale testing"
+    )
+    parser.add_argument("out_dir", type=Path, help="Output directory, laid out like data/processed")
+    parser.add_argument("--brands", type=int, default=10, help="Number of brands")
+    parser.add_argument("--vehicles", type=int, default=100, help="Vehicles per brand")
+    parser.add_argument("--timestamps", type=int, default=1000, help="Readings per vehicle")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", default="2023-01-01", help="First reading time")
+    parser.add_argument("--no-derived", action="store_true", help="Only write master_vehicle_data.csv")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    brands = brand_names(args.brands)
+    rows = args.brands * args.vehicles * args.timestamps
+    print(f"🔄 Generating {len(brands)} brands × {args.vehicles} vehicles × {args.timestamps} readings ({rows:,} rows)")
+
+    started = time.perf_counter()
+    results = generate_fleet(
+        brands,
+        args.out_dir,
+        args.vehicles,
+        args.timestamps,
+        seed=args.seed,
+        start=args.start,
+        derived=not args.no_derived,
+        max_workers=args.workers,
+    )
+    elapsed = time.perf_counter() - started
+
+    total_bytes = 0
+    for brand, result in results.items():
+        total_bytes += result["bytes"]
+        print(f"✅ {brand}: {result['rows']:,} rows, {result['bytes'] / 1024 / 1024:.1f} MiB")
+
+    print(f"✅ GENERATED {total_bytes / 1024 / 1024:.1f} MiB in {elapsed:.1f}s → {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+from pathlib import Path
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.columnar import columnar_dir, convert_csv, read_manifest
+
+
+def ingest_brand(brand_dir: Path, data_dir: Path, force: bool = False):
+    brand = brand_dir.name.lower()
+
+    for csv_path in sorted(brand_dir.glob("*.csv")):
+        table = csv_path.stem
+
+        if not force and read_manifest(brand, table, data_dir) is not None:
+            print(f"⏭️  {brand}/{table}: up to date")
+            continue
+
+        manifest = convert_csv(csv_path, columnar_dir(brand, table, data_dir))
+        print(f"✅ {brand}/{table}: {manifest['rows']} rows, {len(manifest['columns'])} columns")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert processed brand CSVs into memory-mappable columnar files"
+    )
+    parser.add_argument("brands", nargs="*", help="Brands to convert (default: all)")
+    parser.add_argument("--data-dir", type=Path, default=BASE_DATA_DIR)
+    parser.add_argument("--force", action="store_true", help="Reconvert up-to-date tables")
+    args = parser.parse_args()
+
+    if not args.data_dir.exists():
+        print(f"⚠️  Data directory not found at {args.data_dir}")
+        return
+
+    wanted = {b.lower() for b in args.brands}
+
+    for brand_dir in sorted(args.data_dir.iterdir()):
+        if not brand_dir.is_dir():
+            continue
+        if wanted and brand_dir.name.lower() not in wanted:
+            continue
+        ingest_brand(brand_dir, args.data_dir, args.force)
+
+    print("✅ INGEST COMPLETE")
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,27 @@
-from app.utils.csv_loader import load_csv
+from app.utils.aggregates import ranking_payload
+from app.utils.insights import get_insights
+from app.utils.view_registry import load_view
 
-def get_engine_insights(brand: str):
+
+def _system_views(brand: str, temp_file: str, risk_file: str, distribution_file: str):
     return {
-        "temp_performance": load_csv(brand, "engine_temp_perf.csv"),
-        "risk": load_csv(brand, "engine_risk_summary.csv"),
-        "distribution": load_csv(brand, "engine_perf_distribution.csv"),
+        "temp_performance": load_view(brand, temp_file),
+        "risk": load_view(brand, risk_file),
+        "distribution": load_view(brand, distribution_file),
     }
 
+def get_engine_insights(brand: str):
+    return _system_views(brand, "engine_temp_perf.csv", "engine_risk_summary.csv", "engine_perf_distribution.csv")
+
 def get_brake_insights(brand: str):
-    return {
-        "temp_performance": load_csv(brand, "brake_temp_perf.csv"),
-        "risk": load_csv(brand, "brake_risk_summary.csv"),
-        "distribution": load_csv(brand, "brake_wear_distribution.csv"),
-    }
+    return _system_views(brand, "brake_temp_perf.csv", "brake_risk_summary.csv", "brake_wear_distribution.csv")
 
 def get_battery_insights(brand: str):
-    return {
-        "temp_performance": load_csv(brand, "battery_temp_perf.csv"),
-        "risk": load_csv(brand, "battery_risk_summary.csv"),
-        "distribution": load_csv(brand, "battery_health_distribution.csv"),
-    }
+    return _system_views(brand, "battery_temp_perf.csv", "battery_risk_summary.csv", "battery_health_distribution.csv")
 
 def get_summary(brand: str):
-    return load_csv(brand, "summary.csv")
+    insights = get_insights(brand)
+    return insights["summary"] if insights else None
 
 def get_global_ranking():
-    return load_csv("global", "ranking.csv")
+    return ranking_payload()
@@ -0,0 +1,40 @@
+import argparse
+from pathlib import Path
+from app.utils.csv_loader import BASE_DATA_DIR
+from app.utils.rollups import rollup_brands
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recompute each brand's derived views from master_vehicle_data "
+        "(engine performance views are kept as shipped)"
+    )
+    parser.add_argument("brands", nargs="*", help="Brands to roll up (default: all)")
+    parser.add_argument("--data-dir", type=Path, default=BASE_DATA_DIR)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Compute without writing files")
+    args = parser.parse_args()
+
+    if not args.data_dir.exists():
+        print(f"⚠️  Data directory not found at {args.data_dir}")
+        return
+
+    wanted = {b.lower() for b in args.brands}
+    brands = [
+        brand_dir.name.lower()
+        for brand_dir in sorted(args.data_dir.iterdir())
+        if (brand_dir / "master_vehicle_data.csv").exists()
+        or (brand_dir / "columnar" / "master_vehicle_data").exists()
+    ]
+    if wanted:
+        brands = [b for b in brands if b in wanted]
+
+    results = rollup_brands(brands, args.data_dir, write=not args.dry_run, max_workers=args.workers)
+
+    for brand, views in results.items():
+        print(f"✅ {brand}: {len(views)} views")
+
+    print("✅ ROLLUP COMPLETE" if not args.dry_run else "✅ ROLLUP DRY RUN COMPLETE")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+from app.utils import brand_stats, shared_store
+from app.utils.columnar import columnar_dir, convert_csv
+
+MASTER_CSV = Path(__file__).resolve().parents[1] / "data" / "processed" / "audi" / "master_vehicle_data.csv"
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    if not MASTER_CSV.exists():
+        pytest.skip(f"no master data at {MASTER_CSV}")
+    frame = pd.read_csv(MASTER_CSV)
+    # A text column check_metrics accepts but the shared store cannot map
+    frame["service_notes"] = "none"
+    for brand in ("audi", "bmw"):
+        (tmp_path / "data" / brand).mkdir(parents=True)
+        csv_path = tmp_path / "data" / brand / MASTER_CSV.name
+        frame.to_csv(csv_path, index=False)
+        convert_csv(csv_path, columnar_dir(brand, "master_vehicle_data", tmp_path / "data"))
+
+    monkeypatch.setattr(brand_stats, "BASE_DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(shared_store, "SHARED_DATA_DIR", tmp_path / "shared")
+    brand_stats._stats.clear()
+    shared_store._attached.clear()
+    yield tmp_path / "data"
+    brand_stats.shutdown_pool()
+
+
+@pytest.mark.parametrize("pool_size", [1, 2])
+def test_compare_brands(data_dir, monkeypatch, pool_size):
+    monkeypatch.setattr(brand_stats, "COMPARE_POOL_SIZE", pool_size)
+
+    result = brand_stats.compare_brands(["engine_temp_c"], ["count", "mean"])
+
+    assert [b["brand"] for b in result["brands"]] == ["audi", "bmw"]
+    assert result["brands"][0]["metrics"]["engine_temp_c"]["count"] == len(pd.read_csv(MASTER_CSV))
+
+
+@pytest.mark.parametrize("pool_size", [1, 2])
+def test_worker_client_errors_keep_their_status(data_dir, monkeypatch, pool_size):
+    monkeypatch.setattr(brand_stats, "COMPARE_POOL_SIZE", pool_size)
+
+    with pytest.raises(HTTPException) as e:
+        brand_stats.compare_brands(["service_notes"], ["mean"])
+
+    assert e.value.status_code == 400
+    assert "service_notes" in e.value.detail
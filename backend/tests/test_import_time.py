@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Seconds `import app.main` may take in a fresh interpreter
+IMPORT_TIME_BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "0")) or 2.0
+
+# Loaded on first use, never by importing the app
+LAZY_MODULES = ["pandas", "numpy", "sqlalchemy"]
+
+CODE = (
+    "import json, sys, time\n"
+    "t = time.perf_counter()\n"
+    "import app.main\n"
+    "elapsed = time.perf_counter() - t\n"
+    f"print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {LAZY_MODULES!r} if m in sys.modules]}}))\n"
+)
+
+
+def _import_app() -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", CODE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules():
+    assert _import_app()["loaded"] == []
+
+
+def test_import_time_within_budget():
+    # Best of three, so a busy machine does not fail the check on one slow run
+    seconds = min(_import_app()["seconds"] for _ in range(3))
+    assert seconds < IMPORT_TIME_BUDGET_SECONDS, (
+        f"import app.main took {seconds:.3f}s (budget {IMPORT_TIME_BUDGET_SECONDS}s)"
+    )
@@ -0,0 +1,69 @@
+from app.utils.intent_router import INTENTS, IntentRouter, intent_router, tokenize
+
+
+def test_tokenize():
+    assert tokenize("Engine RPM, oil & EV-charge?") == ["engine", "rpm", "oil", "ev", "charge"]
+
+
+def test_single_intent():
+    assert intent_router.route("How is the engine doing?") == ["engine"]
+    assert intent_router.route("battery") == ["battery"]
+    assert intent_router.route("Show the brakes") == ["brakes"]
+    assert intent_router.route("Where do we rank?") == ["ranking"]
+    assert intent_router.route("Fleet overview please") == ["summary"]
+
+
+def test_prefix_matches_suffixes_and_plurals():
+    assert intent_router.route("engines") == ["engine"]
+    assert intent_router.route("Any vehicles overheating?") == ["engine"]
+    assert intent_router.route("What about engine temperatures?") == ["engine"]
+    assert intent_router.route("leaderboards") == ["ranking"]
+
+
+def test_short_keywords_need_exact_tokens():
+    # "ev" and "abs" are too short to match as prefixes
+    assert intent_router.route("every absolute") == []
+
+
+def test_overheat_routes_to_engine():
+    assert intent_router.route("overheat") == ["engine"]
+
+
+def test_temperature_only_adds_to_other_evidence():
+    assert intent_router.route("temperature") == []
+    assert intent_router.route("battery temperature") == ["battery"]
+    assert intent_router.route("brake temperature") == ["brakes"]
+    assert intent_router.route("brake temperature trend") == ["brakes"]
+    assert intent_router.route("engine temperature") == ["engine"]
+    assert intent_router.scores("engine temperature") == {"engine": 1.5}
+
+
+def test_multi_intent_best_first():
+    assert intent_router.route("How do engine and battery compare?") == ["engine", "battery"]
+    assert intent_router.route("Worn brake pads, ABS and the battery") == ["brakes", "battery"]
+
+
+def test_ties_keep_declaration_order():
+    assert intent_router.scores("Brake pads and battery voltage") == {"brakes": 2.0, "battery": 2.0}
+    assert intent_router.route("Brake pads and battery voltage") == ["battery", "brakes"]
+
+
+def test_weak_keywords_need_other_evidence():
+    assert intent_router.route("health") == []
+    assert intent_router.route("wear") == []
+    assert intent_router.route("fleet health status") == ["summary"]
+    assert intent_router.scores("fleet health status") == {"summary": 2.0}
+
+
+def test_no_match():
+    assert intent_router.route("") == []
+    assert intent_router.route("anything else?") == []
+
+
+def test_repeated_keywords_count_once():
+    assert intent_router.scores("engine engine engine") == {"engine": 1.0}
+
+
+def test_min_score():
+    router = IntentRouter(INTENTS, min_score=0.5)
+    assert router.route("health") == ["summary"]
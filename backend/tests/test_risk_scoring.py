@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.risk_scoring import FLAG_WEIGHT, RISK_FEATURES, RISK_FLAGS, score_fleet
+from app.utils.vehicle_index import VehicleIndex
+
+MASTER_CSV = Path(__file__).resolve().parents[1] / "data" / "processed" / "audi" / "master_vehicle_data.csv"
+
+
+@pytest.fixture(scope="module")
+def master():
+    if not MASTER_CSV.exists():
+        pytest.skip(f"no master data at {MASTER_CSV}")
+    return pd.read_csv(MASTER_CSV)
+
+
+def _reference(frame: pd.DataFrame, window: int) -> pd.DataFrame:
+    """
+    Scores the plain pandas way: per-vehicle rolling means over the
+    time-sorted readings, taken at each vehicle's last reading.
+    """
+    frame = frame.assign(timestamp=pd.to_datetime(frame["timestamp"]))
+    frame = frame.sort_values(["vehicle_id", "timestamp"], kind="stable")
+    by_vehicle = frame.groupby("vehicle_id", sort=True)
+
+    scores = pd.DataFrame(index=sorted(frame["vehicle_id"].unique()))
+    scores["score"] = 0.0
+    for name, (direction, weight) in RISK_FEATURES.items():
+        mean, std = frame[name].mean(), frame[name].std(ddof=0)
+        filled = frame[name].fillna(mean)
+        last = filled.groupby(frame["vehicle_id"]).rolling(window, min_periods=1).mean().groupby(level=0).last()
+        z = direction * (last - mean) / (std if std > 0 else 1.0)
+        scores[name] = z
+        scores["score"] += weight * z.clip(lower=0)
+    for flag in RISK_FLAGS:
+        scores["score"] += FLAG_WEIGHT * by_vehicle[flag].apply(lambda s: s.tail(window).mean())
+    return scores
+
+
+@pytest.mark.parametrize("window, chunk_rows", [(48, 250000), (10, 50), (1, 7)])
+def test_matches_pandas_groupby_rolling(master, window, chunk_rows):
+    risk = score_fleet(VehicleIndex(master), window=window, chunk_rows=chunk_rows)
+    expected = _reference(master, window)
+
+    assert list(risk.vehicle_ids) == list(expected.index)
+    np.testing.assert_allclose(risk.scored["score"], expected["score"].to_numpy(), rtol=1e-9, atol=1e-9)
+    for name in RISK_FEATURES:
+        np.testing.assert_allclose(risk.scored["z"][name], expected[name].to_numpy(), rtol=1e-9, atol=1e-9)
+
+    ranked = expected.sort_values("score", ascending=False, kind="stable").index
+    assert [v["vehicle_id"] for v in risk.top(len(risk))] == list(ranked)
+
+
+def test_missing_readings_count_as_fleet_average(master):
+    frame = master.copy()
+    frame.loc[frame.index[::5], "engine_temp_c"] = np.nan
+    frame.loc[frame.index[::7], "battery_voltage_v"] = np.nan
+
+    risk = score_fleet(VehicleIndex(frame), window=10, chunk_rows=50)
+    expected = _reference(frame, 10)
+
+    np.testing.assert_allclose(risk.scored["score"], expected["score"].to_numpy(), rtol=1e-9, atol=1e-9)
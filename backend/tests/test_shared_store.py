@@ -0,0 +1,64 @@
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.utils import shared_store
+from app.utils.columnar import columnar_dir, convert_csv
+from app.utils.shared_store import MASTER_TABLE, materialize
+
+MASTER_CSV = Path(__file__).resolve().parents[1] / "data" / "processed" / "audi" / f"{MASTER_TABLE}.csv"
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    if not MASTER_CSV.exists():
+        pytest.skip(f"no master data at {MASTER_CSV}")
+    (tmp_path / "data" / "audi").mkdir(parents=True)
+    shutil.copy(MASTER_CSV, tmp_path / "data" / "audi" / MASTER_CSV.name)
+    monkeypatch.setattr(shared_store, "SHARED_DATA_DIR", tmp_path / "shared")
+    return tmp_path / "data"
+
+
+def test_converts_csv_without_ingest_copy(data_dir):
+    table_dir, manifest = materialize("audi", data_dir)
+
+    assert table_dir.parent == shared_store.SHARED_DATA_DIR / "audi"
+    assert manifest["rows"] > 0
+
+
+def test_reuses_up_to_date_ingest_copy(data_dir):
+    csv_path = data_dir / "audi" / MASTER_CSV.name
+    convert_csv(csv_path, columnar_dir("audi", MASTER_TABLE, data_dir))
+
+    table_dir, _ = materialize("audi", data_dir)
+
+    assert table_dir == columnar_dir("audi", MASTER_TABLE, data_dir)
+    assert not shared_store.SHARED_DATA_DIR.exists()
+
+
+def test_ignores_ingest_copy_older_than_csv(data_dir):
+    csv_path = data_dir / "audi" / MASTER_CSV.name
+    convert_csv(csv_path, columnar_dir("audi", MASTER_TABLE, data_dir))
+    with open(csv_path, "a") as f:
+        f.write("\n")
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    table_dir, manifest = materialize("audi", data_dir)
+
+    assert table_dir.parent == shared_store.SHARED_DATA_DIR / "audi"
+    assert manifest["source_version"] == [csv_path.stat().st_mtime_ns, csv_path.stat().st_size]
+
+
+def test_ingest_copy_without_csv(data_dir):
+    csv_path = data_dir / "audi" / MASTER_CSV.name
+    convert_csv(csv_path, columnar_dir("audi", MASTER_TABLE, data_dir))
+    csv_path.unlink()
+
+    table_dir, manifest = materialize("audi", data_dir)
+
+    assert table_dir == columnar_dir("audi", MASTER_TABLE, data_dir)
+    assert np.load(table_dir / manifest["columns"][0]["file"], allow_pickle=True).shape == (manifest["rows"],)
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.timeseries import _build, bucket_series, lttb_indices
+from app.utils.vehicle_index import VehicleIndex
+
+MASTER_CSV = Path(__file__).resolve().parents[1] / "data" / "processed" / "audi" / "master_vehicle_data.csv"
+
+TIMES = np.array(
+    ["2024-01-01T00:00:00", "2024-01-01T00:00:10", "2024-01-01T00:00:20",
+     "2024-01-01T00:00:55", "2024-01-01T00:01:00"],
+    dtype="datetime64[s]",
+)
+VALUES = np.array([1.0, 3.0, 2.0, 10.0, 4.0])
+
+
+def test_buckets_hand_worked():
+    # 61 seconds in 2 buckets of just over 30 seconds
+    assert bucket_series(TIMES, VALUES, 2) == {
+        "timestamp": ["2024-01-01 00:00:00", "2024-01-01 00:00:30"],
+        "mean": [2.0, 7.0],
+        "min": [1.0, 4.0],
+        "max": [3.0, 10.0],
+        "count": [3, 2],
+    }
+
+
+def test_empty_buckets_are_left_out():
+    # Nothing falls in 00:00:30-00:00:45
+    assert bucket_series(TIMES, VALUES, 4) == {
+        "timestamp": ["2024-01-01 00:00:00", "2024-01-01 00:00:15", "2024-01-01 00:00:45"],
+        "mean": [2.0, 2.0, 7.0],
+        "min": [1.0, 2.0, 4.0],
+        "max": [3.0, 2.0, 10.0],
+        "count": [2, 1, 2],
+    }
+
+
+def test_single_bucket_and_single_reading():
+    assert bucket_series(TIMES, VALUES, 1)["count"] == [5]
+    assert bucket_series(TIMES[:1], VALUES[:1], 10) == {
+        "timestamp": ["2024-01-01 00:00:00"], "mean": [1.0], "min": [1.0], "max": [1.0], "count": [1],
+    }
+
+
+X = np.arange(7.0)
+Y = np.array([0.0, 5.0, 1.0, 1.0, 8.0, 2.0, 0.0])
+
+
+def test_lttb_hand_worked():
+    # Inner buckets [1, 3) and [3, 6); the last one is scored against the
+    # final reading rather than a bucket average
+    assert lttb_indices(X, Y, 4).tolist() == [0, 1, 4, 6]
+    assert lttb_indices(X, Y, 3).tolist() == [0, 4, 6]
+
+
+def test_lttb_fewer_than_three_points():
+    assert lttb_indices(X, Y, 2).tolist() == [0, 6]
+    assert lttb_indices(X, Y, 1).tolist() == [0]
+    assert lttb_indices(X, Y, 0).tolist() == []
+    assert lttb_indices(X[:1], Y[:1], 2).tolist() == [0]
+
+
+def test_lttb_keeps_everything_when_points_cover_the_series():
+    assert lttb_indices(X, Y, 7).tolist() == list(range(7))
+    assert lttb_indices(X, Y, 100).tolist() == list(range(7))
+
+
+@pytest.mark.parametrize("n, points", [(1000, 3), (1000, 50), (1000, 999), (10, 4), (101, 7)])
+def test_lttb_bounds(n, points):
+    rng = np.random.default_rng(n + points)
+    x = np.sort(rng.uniform(0, 1e6, n))
+    y = rng.normal(size=n)
+
+    chosen = lttb_indices(x, y, points)
+
+    assert len(chosen) == min(points, n)
+    assert chosen[0] == 0 and chosen[-1] == n - 1
+    assert np.all(np.diff(chosen) > 0)
+
+
+@pytest.fixture(scope="module")
+def index():
+    if not MASTER_CSV.exists():
+        pytest.skip(f"no master data at {MASTER_CSV}")
+    return VehicleIndex(pd.read_csv(MASTER_CSV))
+
+
+@pytest.mark.parametrize("points", [1, 7, 50, 5000])
+def test_bucket_counts_sum_to_total_readings(index, points):
+    result = _build("audi", index, "test", "engine_temp_c", None, None, None, points, "buckets")
+
+    assert result["total_readings"] == len(index.frame)
+    assert sum(p["count"] for p in result["points"]) == result["total_readings"]
+    assert len(result["points"]) <= points
+
+
+@pytest.mark.parametrize("points", [2, 7, 50, 5000])
+def test_lttb_keeps_first_and_last_reading(index, points):
+    vehicle_id = str(index.vehicle_ids[0])
+    first, last = index.row_range(vehicle_id)
+    result = _build("audi", index, "test", "engine_temp_c", vehicle_id, None, None, points, "lttb")
+
+    values = index.frame["engine_temp_c"].to_numpy()[first:last]
+    assert len(result["points"]) == min(points, last - first)
+    assert result["points"][0]["value"] == values[0]
+    assert result["points"][-1]["value"] == values[-1]
@@ -0,0 +1,47 @@
+import time
+from app.utils.ttl_cache import TTLCache
+
+
+def test_get_put_and_stats():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats() == {"entries": 1, "max_entries": 10, "hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_expires_after_ttl():
+    cache = TTLCache(max_entries=10, ttl_seconds=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_expires_at_earlier_deadline():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    cache.put("past", 1, expires_at=time.time() - 1)
+    cache.put("future", 2, expires_at=time.time() + 3600)
+    assert cache.get("past") is None
+    assert cache.get("future") == 2
+
+
+def test_discard_and_clear():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.discard("a")
+    cache.discard("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("b") is None
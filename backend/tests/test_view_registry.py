@@ -0,0 +1,52 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from app.utils import csv_loader, view_registry
+from app.utils.view_registry import VIEW_SCHEMAS, validate_views
+
+BRAND_DIR = Path(__file__).resolve().parents[1] / "data" / "processed" / "audi"
+
+
+def test_parse_typed_columns():
+    df = pd.DataFrame({"brake_issue_imminent": [0], "fraction": [0.25]})
+    assert VIEW_SCHEMAS["brake_risk_summary.csv"].parse(df) == {
+        "brake_issue_imminent": [0],
+        "fraction": [0.25],
+    }
+
+
+def test_duplicated_header_is_read_positionally():
+    df = pd.DataFrame([["Good", 3]], columns=["count", "count.1"])
+    assert VIEW_SCHEMAS["brake_wear_distribution.csv"].parse(df) == {"count": ["Good"], "count.1": [3]}
+
+
+@pytest.mark.parametrize("df, message", [
+    (pd.DataFrame({"temp_band": ["low"], "other": [1.0]}), "expected header"),
+    (pd.DataFrame({"temp_band": ["low"], "avg_engine_performance_percent": [None]}), "missing values"),
+    (pd.DataFrame({"temp_band": ["low"], "avg_engine_performance_percent": ["abc"]}), "not numeric"),
+])
+def test_malformed_frames_are_rejected(df, message):
+    with pytest.raises(ValueError, match=message):
+        VIEW_SCHEMAS["engine_temp_perf.csv"].parse(df)
+
+
+def test_validate_views_reports_malformed_files(tmp_path, monkeypatch):
+    if not BRAND_DIR.exists():
+        pytest.skip(f"no data at {BRAND_DIR}")
+    shutil.copytree(BRAND_DIR, tmp_path / "audi", ignore=shutil.ignore_patterns("master_*"))
+    shutil.copytree(BRAND_DIR, tmp_path / "bmw", ignore=shutil.ignore_patterns("master_*"))
+    (tmp_path / "bmw" / "battery_temp_perf.csv").write_text("temp_band,avg_battery_health_percent\nlow,abc\n")
+    (tmp_path / "bmw" / "engine_risk_summary.csv").write_text('engine_failure_imminent,fraction\n"0,1\n')
+
+    monkeypatch.setattr(csv_loader, "BASE_DATA_DIR", tmp_path)
+    monkeypatch.setattr(view_registry, "BASE_DATA_DIR", tmp_path)
+
+    failures = validate_views()
+
+    assert sorted(failure.split(":")[0] for failure in failures) == [
+        "bmw/battery_temp_perf.csv",
+        "bmw/engine_risk_summary.csv",
+    ]